@@ -0,0 +1,209 @@
+import json
+import os
+import platform
+import re
+import shlex
+import subprocess
+import threading
+import time
+
+from intenciones import buscar_nombres, normalizar_nombre
+
+# --- ÍNDICE DE APLICACIONES INSTALADAS ---
+RUTA_CACHE_APLICACIONES = os.path.join(os.path.expanduser('~'), ".eva_cache", "aplicaciones.json")
+VALIDEZ_INDICE = 60  # Segundos entre comprobaciones de las fechas de modificación
+VERSION_CACHE = 1
+CODIGOS_EXEC = re.compile(r"%[fFuUdDnNickvm]")  # Parámetros de Exec que no se usan al abrir sin archivos
+
+
+def carpetas_aplicaciones(sistema=None):
+    """Carpetas donde el sistema operativo registra los lanzadores de aplicaciones"""
+    sistema = sistema or platform.system()
+    home = os.path.expanduser('~')
+    if sistema == "Windows":
+        return [os.path.join(os.environ.get(variable, ""), "Microsoft", "Windows", "Start Menu", "Programs")
+                for variable in ("APPDATA", "PROGRAMDATA") if os.environ.get(variable)]
+    if sistema == "Darwin":
+        return ["/Applications", "/System/Applications", "/System/Applications/Utilities",
+                os.path.join(home, "Applications")]
+    datos = os.environ.get("XDG_DATA_HOME") or os.path.join(home, ".local", "share")
+    compartidos = (os.environ.get("XDG_DATA_DIRS") or "/usr/local/share:/usr/share").split(":")
+    carpetas = [os.path.join(d, "applications") for d in [datos, *compartidos] if d]
+    carpetas += ["/var/lib/flatpak/exports/share/applications", "/var/lib/snapd/desktop/applications",
+                 os.path.join(datos, "flatpak", "exports", "share", "applications")]
+    return list(dict.fromkeys(carpetas))
+
+
+def leer_desktop(ruta):
+    """Entrada [Desktop Entry] de un archivo .desktop: {nombre, nombres, comando} o None si no se muestra"""
+    campos = {}
+    seccion = None
+    with open(ruta, 'r', encoding='utf-8', errors='replace') as f:
+        for linea in f:
+            linea = linea.strip()
+            if linea.startswith("["):
+                if seccion == "[Desktop Entry]":
+                    break  # Las acciones adicionales no interesan
+                seccion = linea
+            elif seccion == "[Desktop Entry]" and "=" in linea:
+                clave, valor = linea.split("=", 1)
+                campos.setdefault(clave.strip(), valor.strip())
+    if (campos.get("Type") != "Application" or campos.get("NoDisplay") == "true"
+            or campos.get("Hidden") == "true" or "Exec" not in campos):
+        return None
+    nombres = [campos.get(clave) for clave in ("Name[es]", "Name", "GenericName[es]", "GenericName")]
+    nombres.append(os.path.splitext(os.path.basename(ruta))[0])  # org.gnome.Calculator
+    nombres = [n for n in nombres if n]
+    return {"nombre": nombres[0], "nombres": nombres,
+            "comando": " ".join(CODIGOS_EXEC.sub("", campos["Exec"]).split())}
+
+
+class IndiceAplicaciones:
+    """Nombre normalizado -> lanzador, guardado en disco y revalidado por mtime
+
+    Solo se vuelve a recorrer el disco si cambió la fecha de modificación de
+    alguna de las carpetas recorridas (instalar o desinstalar una aplicación
+    modifica la carpeta que contiene su lanzador).
+    """
+
+    def __init__(self, ruta_cache=RUTA_CACHE_APLICACIONES, carpetas=None):
+        self.ruta_cache = ruta_cache
+        self.carpetas = carpetas if carpetas is not None else carpetas_aplicaciones()
+        self.aplicaciones = []  # Lista de {nombre, nombres, comando | ruta}
+        self.indice = {}  # Nombre normalizado -> lanzadores; se reemplaza entero al reindexar
+        self._mtimes = {}  # Carpeta recorrida -> mtime_ns
+        self._validado = 0.0
+        self._revalidando = False
+        self._lock = threading.Lock()
+
+    def _fechas(self, carpetas):
+        fechas = {}
+        for carpeta in carpetas:
+            try:
+                fechas[carpeta] = os.stat(carpeta).st_mtime_ns
+            except OSError:
+                fechas[carpeta] = None
+        return fechas
+
+    def _vigente(self):
+        return bool(self._mtimes) and self._fechas(self._mtimes) == self._mtimes
+
+    def cargar(self):
+        """Usa la caché si sigue vigente; si no, recorre las carpetas y la reescribe"""
+        with self._lock:
+            if self._validado and time.time() - self._validado < VALIDEZ_INDICE:
+                return
+            if not self.aplicaciones:
+                self._leer_cache()
+            if not self._vigente():
+                self._recorrer()
+                self._guardar_cache()
+            self._validado = time.time()
+
+    def cargar_en_segundo_plano(self):
+        """cargar() en un hilo aparte; no lanza otro si ya hay uno en curso"""
+        if self._revalidando:
+            return
+        self._revalidando = True
+
+        def proceso():
+            try:
+                self.cargar()
+            except Exception as e:
+                print(f"Error cargando el índice de aplicaciones: {e}")
+            finally:
+                self._revalidando = False
+
+        threading.Thread(target=proceso, daemon=True, name="aplicaciones").start()
+
+    def _leer_cache(self):
+        """Carga la caché; si falta, está corrupta o es de otra versión, se ignora y se reconstruye"""
+        try:
+            with open(self.ruta_cache, 'r', encoding='utf-8') as f:
+                datos = json.load(f)
+            if datos["version"] != VERSION_CACHE or set(self.carpetas) - set(datos["mtimes"]):
+                return
+            mtimes = dict(datos["mtimes"])
+            self._indexar(list(datos["aplicaciones"]))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self._indexar([])
+            return
+        self._mtimes = mtimes
+
+    def _guardar_cache(self):
+        try:
+            os.makedirs(os.path.dirname(self.ruta_cache), exist_ok=True)
+            temporal = f"{self.ruta_cache}.{os.getpid()}.tmp"
+            with open(temporal, 'w', encoding='utf-8') as f:
+                json.dump({"version": VERSION_CACHE, "mtimes": self._mtimes,
+                           "aplicaciones": self.aplicaciones}, f, ensure_ascii=False)
+            os.replace(temporal, self.ruta_cache)
+        except OSError as e:
+            print(f"No se pudo guardar el índice de aplicaciones: {e}")
+
+    def _recorrer(self):
+        aplicaciones, recorridas = [], []
+        for raiz in self.carpetas:
+            if not os.path.isdir(raiz):
+                recorridas.append(raiz)
+                continue
+            for carpeta, subcarpetas, archivos in os.walk(raiz):
+                recorridas.append(carpeta)
+                # Un .app es un paquete: se registra y no se entra en él
+                for paquete in [s for s in subcarpetas if s.endswith(".app")]:
+                    subcarpetas.remove(paquete)
+                    nombre = paquete[:-4]
+                    aplicaciones.append({"nombre": nombre, "nombres": [nombre],
+                                         "ruta": os.path.join(carpeta, paquete)})
+                for archivo in archivos:
+                    ruta = os.path.join(carpeta, archivo)
+                    if archivo.endswith(".desktop"):
+                        try:
+                            entrada = leer_desktop(ruta)
+                        except OSError:
+                            continue
+                        if entrada:
+                            aplicaciones.append(entrada)
+                    elif archivo.lower().endswith(".lnk"):
+                        nombre = archivo[:-4]
+                        aplicaciones.append({"nombre": nombre, "nombres": [nombre], "ruta": ruta})
+        self._mtimes = self._fechas(recorridas)
+        self._indexar(aplicaciones)
+
+    def _indexar(self, aplicaciones):
+        indice = {}
+        for aplicacion in aplicaciones:
+            for clave in {normalizar_nombre(nombre) for nombre in aplicacion["nombres"]} - {""}:
+                indice.setdefault(clave, []).append(aplicacion)
+        # Un solo reemplazo: buscar() lee el índice sin lock mientras se reconstruye
+        self.aplicaciones, self.indice = aplicaciones, indice
+
+    def buscar(self, nombre):
+        """Lanzadores que corresponden al nombre dicho, del más al menos parecido
+
+        Responde con el índice en memoria; si ya pasó VALIDEZ_INDICE, lo
+        revalida en segundo plano para la próxima búsqueda. Solo espera a
+        cargar() cuando todavía no hay ningún índice.
+        """
+        if not self._validado:
+            self.cargar()
+        elif time.time() - self._validado >= VALIDEZ_INDICE:
+            self.cargar_en_segundo_plano()
+        indice = self.indice
+        resultado = []
+        for clave in buscar_nombres(nombre, indice):
+            resultado.extend(a for a in indice[clave] if a not in resultado)
+        return resultado
+
+    def abrir(self, aplicacion):
+        """Lanza una aplicación del índice sin esperar a que termine"""
+        if "comando" in aplicacion:
+            subprocess.Popen(shlex.split(aplicacion["comando"]), stdout=subprocess.DEVNULL,
+                             stderr=subprocess.DEVNULL, start_new_session=True)
+        elif platform.system() == "Windows":
+            os.startfile(aplicacion["ruta"])
+        else:
+            subprocess.Popen(["open", aplicacion["ruta"]], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+APLICACIONES = IndiceAplicaciones()
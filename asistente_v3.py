@@ -1,193 +1,497 @@
-import speech_recognition as sr
-import pyttsx3
-import pywhatkit
-import webbrowser
+import argparse
+import importlib.util
 import json
+import re
 import os
+import sys
 import time
 import threading
-import subprocess
 import platform
-import psutil
-from PIL import Image
 from concurrent.futures import ThreadPoolExecutor
-import customtkinter as ctk
-import tkinter as tk
 from datetime import datetime
-import requests
-from plyer import notification
-import schedule
+from carga_diferida import (importar_diferido, medir_importacion, perfil_importaciones,
+                            precargar_en_segundo_plano)
+
+INICIO_ARRANQUE = time.perf_counter()
+
+# Solo se importa al arrancar lo necesario para mostrar la ventana y escuchar
+with medir_importacion("speech_recognition"):
+    import speech_recognition as sr
+with medir_importacion("psutil y monitor"):
+    from monitor_sistema import MONITOR
+with medir_importacion("captura, reconocimiento y voz"):
+    from captura_audio import CapturaContinua
+    from palabra_clave import DetectorPalabraClave
+    from reconocimiento import MOTORES, ReconocedorGoogle, crear_reconocedor
+    from vad import recortar_silencio
+    from estadisticas import ESTADISTICAS
+    from trazas import TRAZAS, Traza
+    from voz import TrabajadorVoz
+with medir_importacion("comandos"):
+    from comandos import REGISTRO
+    from comandos.sistema import obtener_info_sistema
+    from aplicaciones import APLICACIONES
+
+# Se cargan al crear la ventana, después de validar dependencias (el daemon no los usa)
+ctk = importar_diferido("customtkinter")
+tk = importar_diferido("tkinter")
+graficas_sistema = importar_diferido("graficas_sistema")
 
 # --- CONFIGURACIÓN GLOBAL ---
 PALABRA_ACTIVACION = "eva"
 ENERGY_THRESHOLD = 350
 CONVERSATION_TIMEOUT = 30
-
-# Inicialización optimizada del motor de voz
-engine = pyttsx3.init()
-engine.setProperty('rate', 220)  # Más rápido
-engine.setProperty('volume', 0.9)
-voices = engine.getProperty('voices')
-if len(voices) > 1:
-    engine.setProperty('voice', voices[1].id)  # Voz femenina si está disponible
+MODO_EARCON = False  # Tono breve en lugar del saludo hablado tras la palabra de activación
+FACTOR_BARGE_IN = 3.0  # Mientras EVA habla, la voz debe superar este múltiplo del umbral (eco)
+VOZ_ACTIVA = True  # Sin voz las respuestas solo se muestran (daemon y pruebas)
+
+# Comandos que se pueden ejecutar en cuanto aparecen en un resultado parcial
+COMANDOS_INMEDIATOS = re.compile(
+    r"^(qué hora es|qué día es|(sube|subir|aumenta|aumentar) (el )?volumen|"
+    r"(baja|bajar|disminuye|disminuir) (el )?volumen|silencia|silenciar)$")
+
+# Frases que se pre-renderizan para responder sin esperar a la síntesis
+FRASES_FIJAS = [
+    "Hola, ¿en qué puedo ayudarte?",
+    "EVA activado y listo para ayudar",
+    "Volviendo a modo pasivo",
+    "De acuerdo, volviendo a modo pasivo",
+    "Comando no reconocido",
+    "Hubo un error procesando tu comando",
+]
+
+# Motor de voz en un proceso aparte (voz femenina si está disponible)
+VOZ = TrabajadorVoz(velocidad=220, volumen=0.9, indice_voz=1, frases_fijas=FRASES_FIJAS)
 
 # Inicialización optimizada del reconocedor
 listener = sr.Recognizer()
 listener.energy_threshold = ENERGY_THRESHOLD
 listener.pause_threshold = 0.5  # Más rápido
 listener.phrase_threshold = 0.3
-# Indicador de si el asistente está hablando actualmente
-HABLANDO = False
 
-# --- FUNCIONES OPTIMIZADAS ---
+# Motor de reconocimiento activo (se puede cambiar con --reconocedor)
+RECONOCEDOR = ReconocedorGoogle(listener, idioma="es-CO")
 
-def cargar_favoritos():
-    try:
-        with open('favoritos.json', 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        print("Creando archivo de favoritos...")
-        favoritos_default = {
-            "música relajante": "https://www.youtube.com/watch?v=jfKfPfyJRdk",
-            "noticias": "https://www.youtube.com/watch?v=live_news"
-        }
-        with open('favoritos.json', 'w', encoding='utf-8') as f:
-            json.dump(favoritos_default, f, indent=2, ensure_ascii=False)
-        return favoritos_default
+# Flujo de micrófono persistente (se abre en la primera escucha)
+CAPTURA = CapturaContinua(listener)
+CAPTURA.en_eco = lambda: VOZ.hablando  # VOZ se busca al llamar: el benchmark la reemplaza
 
-FAVORITOS = cargar_favoritos()
+# Detector local de la palabra de activación (requiere grabar muestras una vez)
+DETECTOR_PALABRA = DetectorPalabraClave()
 
-def hablar(texto, priority=False):
-    """Hablar optimizado con prioridad"""
-    global HABLANDO
-    print(f"Asistente: {texto}")
-    if priority:
-        engine.stop()  # Detiene cualquier habla anterior
-    HABLANDO = True
-    engine.say(texto)
-    engine.runAndWait()
-    HABLANDO = False
+# --- FUNCIONES OPTIMIZADAS ---
 
-def escuchar_comando_optimizado(timeout=3):
-    """Escucha optimizada y más rápida"""
-    with sr.Microphone() as source:
-        global HABLANDO
-        if HABLANDO:
-            return ""
-        try:
-            # Calibración rápida solo si es necesario
-            listener.adjust_for_ambient_noise(source, duration=0.5)
-            audio = listener.listen(source, timeout=timeout, phrase_time_limit=8)
-            
-            # Reconocimiento en paralelo para mayor velocidad
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(listener.recognize_google, audio, language="es-CO")
-                comando = future.result(timeout=5)
-                print(f"Usuario: {comando}")
-                return comando.lower()
-        except:
-            return ""
+def hablar(texto, priority=False, esperar=False, traza=None):
+    """Encola el texto en el proceso de voz sin bloquear al llamador
 
-# --- FUNCIONES DE SISTEMA OPTIMIZADAS ---
+    Si se pasa una traza, se cierra con los tiempos de síntesis y reproducción.
+    """
+    print(f"Asistente: {texto}")
+    if not VOZ_ACTIVA:
+        if traza:
+            traza.finalizar()
+        terminado = threading.Event()
+        terminado.set()
+        return terminado
+    terminado = VOZ.decir(texto, prioritario=priority, al_terminar=traza.cerrar_con_voz if traza else None)
+    if esperar:
+        terminado.wait()
+    return terminado
+
+def umbral_escucha():
+    """Umbral de energía vigente, más alto mientras EVA habla para ignorar su propio eco"""
+    # El umbral de ruido se actualiza continuamente en el hilo de captura
+    if VOZ.hablando:
+        return listener.energy_threshold * FACTOR_BARGE_IN
+    return listener.energy_threshold
+
+def interrumpir_si_habla():
+    """Barge-in: la voz del usuario corta la respuesta en curso"""
+    if VOZ.hablando:
+        VOZ.callar()
+        ESTADISTICAS.registrar("interrupciones_usuario", 1)
+
+def escuchar_audio(timeout=3, phrase_time_limit=8, al_bloque=None, traza=None):
+    """Extrae la siguiente frase del flujo continuo del micrófono"""
+    traza = traza or Traza()
+    
+    def al_inicio():
+        traza.marcar_inicio_habla()
+        interrumpir_si_habla()
+    
+    CAPTURA.iniciar()
+    audio = CAPTURA.escuchar_frase(timeout=timeout, phrase_time_limit=phrase_time_limit,
+                                   al_bloque=al_bloque, umbral=umbral_escucha,
+                                   al_inicio=al_inicio)
+    traza.marcar_fin_habla()
+    return audio
+
+def recortar_voz(audio, traza=None):
+    """Quita silencios antes de enviar el audio y registra el ahorro"""
+    with (traza or Traza()).etapa("vad"):
+        recortado, ahorro = recortar_silencio(audio, CAPTURA.estimador.umbral)
+    ESTADISTICAS.registrar("vad_bytes_ahorrados", ahorro["bytes_ahorrados"])
+    ESTADISTICAS.registrar("vad_ms_ahorrados", ahorro["ms_ahorrados"])
+    if recortado is None:
+        raise sr.UnknownValueError()  # Sin voz: no vale la pena consultar al motor
+    return recortado
+
+def reconocer_audio(audio, traza=None):
+    """Transcribe una frase ya capturada con el motor activo"""
+    traza = traza or Traza()
+    recortado = recortar_voz(audio, traza)
+    with traza.etapa("reconocimiento"):
+        comando = RECONOCEDOR.reconocer(recortado)
+    print(f"Usuario: {comando}")
+    return comando.lower()
+
+def configurar_reconocedor(nombre, ruta_modelo=None):
+    """Cambia el motor de reconocimiento (google, vosk, sphinx o replay)"""
+    global RECONOCEDOR
+    RECONOCEDOR = crear_reconocedor(nombre, listener, ruta_modelo)
+
+def inicializar_componentes(motor="google", ruta_modelo=None, voz=True, microfono=True):
+    """Etapa lenta del arranque: proceso de voz, motor de reconocimiento y micrófono
+
+    Se ejecuta en segundo plano para que la ventana aparezca de inmediato.
+    """
+    if voz:
+        VOZ.iniciar()  # El proceso de voz inicializa pyttsx3 y pre-renderiza las frases fijas
+    if motor != "google":
+        configurar_reconocedor(motor, ruta_modelo)  # Los modelos locales tardan en cargar
+    if microfono:
+        CAPTURA.iniciar()
+
+def es_comando_inmediato(texto):
+    """Indica si un resultado parcial ya es un comando completo e inequívoco"""
+    return bool(COMANDOS_INMEDIATOS.match(texto.lower().strip()))
+
+def escuchar_comando_streaming(timeout=3, traza=None):
+    """Transcribe mientras el usuario habla y corta en cuanto el comando es inequívoco"""
+    estado = {"flujo": None, "parcial": "", "repeticiones": 0}
+    
+    def al_bloque(bloque):
+        if bloque is None or estado["flujo"] is None:
+            # Nueva frase (o ruido descartado): empezar un flujo limpio
+            estado.update(flujo=RECONOCEDOR.iniciar_flujo(CAPTURA.frecuencia, CAPTURA.ancho_muestra),
+                          parcial="", repeticiones=0)
+            if bloque is None:
+                return False
+        parcial = estado["flujo"].alimentar(bloque)
+        if not parcial:
+            return False
+        # Se exige que la hipótesis se repita para no cortar a mitad de palabra
+        estado["repeticiones"] = estado["repeticiones"] + 1 if parcial == estado["parcial"] else 0
+        estado["parcial"] = parcial
+        return estado["repeticiones"] >= 1 and es_comando_inmediato(parcial)
+    
+    traza = traza or Traza()
+    escuchar_audio(timeout=timeout, al_bloque=al_bloque, traza=traza)
+    # El reconocimiento ocurre mientras se habla; aquí solo se mide lo que queda al final
+    with traza.etapa("reconocimiento"):
+        if es_comando_inmediato(estado["parcial"]):
+            comando = estado["parcial"]
+            ESTADISTICAS.registrar("comandos_anticipados", 1)
+        else:
+            comando = estado["flujo"].finalizar()
+    print(f"Usuario: {comando}")
+    return comando.lower()
 
-def obtener_info_sistema():
-    """Información del sistema ultra rápida"""
+def escuchar_comando_optimizado(timeout=3, traza=None):
+    """Escucha optimizada sobre el flujo continuo del micrófono
+    
+    También escucha mientras EVA habla: si el usuario empieza a hablar,
+    la respuesta se corta y esa misma frase se reconoce como comando.
+    """
     try:
-        cpu = psutil.cpu_percent(interval=0.1)
-        memoria = psutil.virtual_memory().percent
-        disco = psutil.disk_usage('/').percent
-        return f"CPU al {cpu:.1f}%, RAM al {memoria:.1f}%, disco al {disco:.1f}%"
+        if RECONOCEDOR.soporta_parciales:
+            return escuchar_comando_streaming(timeout=timeout, traza=traza)
+        return reconocer_audio(escuchar_audio(timeout=timeout, traza=traza), traza)
     except:
-        return "No pude obtener la información del sistema"
+        return ""
 
-def abrir_app_rapido(app_name):
-    """Apertura ultra rápida de aplicaciones"""
-    sistema = platform.system()
-    apps = {
-        "Windows": {
-            "calculadora": "calc.exe",
-            "notepad": "notepad.exe",
-            "explorador": "explorer.exe",
-            "administrador": "taskmgr.exe",
-            "paint": "mspaint.exe"
-        },
-        "Darwin": {
-            "calculadora": "open -a Calculator",
-            "notas": "open -a TextEdit",
-            "finder": "open -a Finder",
-            "monitor": "open -a 'Activity Monitor'"
-        },
-        "Linux": {
-            "calculadora": "gnome-calculator",
-            "editor": "gedit",
-            "archivos": "nautilus",
-            "monitor": "gnome-system-monitor"
-        }
-    }
+def detectar_palabra_activacion(timeout=2, traza=None):
+    """Espera la palabra de activación sin enviar audio al reconocedor
     
-    cmd = apps.get(sistema, {}).get(app_name)
-    if cmd:
-        # Usar Popen para no bloquear
-        subprocess.Popen(cmd, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        return True
-    return False
-
-def buscar_youtube_rapido(query):
-    """Búsqueda de YouTube optimizada"""
+    Devuelve None si no se detectó. Si la frase continúa después de la palabra
+    (por ejemplo "eva qué hora es"), devuelve solo ese resto transcrito.
+    """
+    if VOZ.hablando:
+        return None
     try:
-        # Usar threading para no bloquear
-        def abrir_youtube():
-            pywhatkit.playonyt(query)
-        
-        thread = threading.Thread(target=abrir_youtube)
-        thread.daemon = True
-        thread.start()
-        return True
+        audio = escuchar_audio(timeout=timeout, traza=traza)
+        detectada, fin, _ = DETECTOR_PALABRA.detectar(audio)
     except:
-        return False
-
-def buscar_google_rapido(query):
-    """Búsqueda de Google ultra rápida"""
-    url = f"https://www.google.com/search?q={query.replace(' ', '+')}"
-    threading.Thread(target=lambda: webbrowser.open(url), daemon=True).start()
-
-def controlar_volumen(accion):
-    """Control de volumen rápido"""
-    sistema = platform.system()
-    if sistema == "Windows":
-        if accion == "subir":
-            os.system("nircmd changesysvolume 5000")
-        elif accion == "bajar":
-            os.system("nircmd changesysvolume -5000")
-        elif accion == "silenciar":
-            os.system("nircmd mutesysvolume 1")
-
-def obtener_clima_rapido():
-    """Obtiene el clima de forma rápida"""
+        return None
+    if not detectada:
+        return None
+    
+    # Solo el audio posterior a la palabra llega al reconocedor
+    resto = audio.get_segment(start_ms=fin * 1000)
+    if len(resto.frame_data) < audio.sample_rate * audio.sample_width * 0.5:
+        return ""
     try:
-        # API gratuita de OpenWeatherMap (necesitas registrarte)
-        # Por simplicidad, retornamos un mensaje genérico
-        return "El clima está agradable hoy"
+        return reconocer_audio(resto, traza)
     except:
-        return "No pude obtener el clima"
+        return ""
+
+# --- NÚCLEO DEL ASISTENTE ---
+
+class NucleoEVA:
+    """Bucle de escucha y procesamiento de comandos, sin interfaz gráfica
 
-def crear_recordatorio(mensaje, minutos):
-    """Crea recordatorios rápidos"""
-    def mostrar_recordatorio():
-        time.sleep(minutos * 60)
-        notification.notify(
-            title="Recordatorio EVA",
-            message=mensaje,
-            timeout=10
-        )
+    La ventana (AsistenteEVA) y el modo daemon comparten esta lógica; cada
+    interfaz redefine mostrar, mostrar_estado e indicador_audio.
+    """
+    def __init__(self):
+        self.asistente_activo = False
+        self.modo_conversacion = False
+        self.ultimo_comando_tiempo = 0
+        self.estado = None
+        self.componentes_listos = threading.Event()
+        self.setup_executor()
+        MONITOR.iniciar()  # CPU, RAM, disco y red se leen de sus muestras, sin bloquear
+    
+    def setup_executor(self):
+        """Configura el executor para tareas paralelas"""
+        self.executor = ThreadPoolExecutor(max_workers=3)
+    
+    def mostrar(self, tipo, mensaje):
+        """Publica un mensaje de la conversación (se puede llamar desde cualquier hilo)"""
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] {tipo}: {mensaje}")
+    
+    def mostrar_estado(self, texto):
+        """Informa el estado del asistente (en consola, solo cuando cambia)"""
+        if texto != self.estado:
+            self.estado = texto
+            print(texto)
+    
+    def indicador_audio(self, activo):
+        """Señala que se está escuchando un comando"""
+        pass
+    
+    def iniciar_componentes(self, motor="google", ruta_modelo=None, voz=True, microfono=True):
+        """Inicializa voz, reconocedor y micrófono sin bloquear al llamador"""
+        def proceso_inicio():
+            inicio = time.time()
+            try:
+                inicializar_componentes(motor, ruta_modelo, voz, microfono)
+                mensaje = f"Voz y micrófono listos en {(time.time() - inicio) * 1000:.0f} ms"
+                estado = "🔴 Estado: Inactivo - Listo"
+            except Exception as e:
+                mensaje = f"Error iniciando componentes: {str(e)}"
+                estado = "⚠️ Estado: Error al iniciar"
+            ESTADISTICAS.registrar("inicio_componentes_ms", (time.time() - inicio) * 1000)
+            self.componentes_listos.set()
+            
+            if not self.asistente_activo:
+                self.mostrar_estado(estado)
+            self.mostrar("Sistema", mensaje)
+            # Con el micrófono ya escuchando: revalidar (o crear) el índice antes del primer "abre"
+            APLICACIONES.cargar_en_segundo_plano()
+        
+        threading.Thread(target=proceso_inicio, daemon=True).start()
+    
+    def ejecutar_asistente_loop(self):
+        """Loop principal del asistente optimizado"""
+        self.componentes_listos.wait()  # La primera escucha empieza en cuanto hay micrófono
+        hablar("EVA activado y listo para ayudar", priority=True)
+        
+        activacion = None  # (inicio, aviso) pendiente de medir al empezar a escuchar el comando
+        while self.asistente_activo:
+            try:
+                # Escuchar palabra de activación
+                traza = TRAZAS.nueva()  # Solo se guarda si la frase termina en un comando
+                if not self.modo_conversacion:
+                    self.mostrar_estado(f"🟡 Esperando '{PALABRA_ACTIVACION}'...")
+                    
+                    if DETECTOR_PALABRA.entrenado_para(PALABRA_ACTIVACION):
+                        resto = detectar_palabra_activacion(timeout=2, traza=traza)
+                        activado = resto is not None
+                        comando = f"{PALABRA_ACTIVACION} {resto or ''}".strip()
+                    else:
+                        comando = escuchar_comando_optimizado(timeout=2)
+                        activado = bool(comando) and PALABRA_ACTIVACION in comando
+                        resto = None
+                    
+                    if activado:
+                        inicio_activacion = time.time()
+                        self.modo_conversacion = True
+                        self.ultimo_comando_tiempo = time.time()
+                        
+                        self.mostrar("Usuario", comando)
+                        self.mostrar_estado("🟢 Modo conversación activo")
+                        
+                        # Si el comando vino junto con la palabra, se ejecuta directamente
+                        if resto:
+                            self.executor.submit(self.procesar_comando, resto, traza)
+                        elif MODO_EARCON:
+                            # Tono corto en paralelo: la escucha del comando empieza ya
+                            activacion = (inicio_activacion, VOZ.reproducir_earcon())
+                        else:
+                            activacion = (inicio_activacion, hablar("Hola, ¿en qué puedo ayudarte?", priority=True))
+                        continue
+                
+                # Modo conversación activo
+                if self.modo_conversacion:
+                    if time.time() - self.ultimo_comando_tiempo > CONVERSATION_TIMEOUT:
+                        self.modo_conversacion = False
+                        hablar("Volviendo a modo pasivo")
+                        continue
+                    
+                    self.indicador_audio(True)
+                    if activacion:
+                        self.medir_activacion(*activacion)
+                        activacion = None
+                    comando = escuchar_comando_optimizado(timeout=8, traza=traza)
+                    self.indicador_audio(False)
+                    
+                    if comando:
+                        self.ultimo_comando_tiempo = time.time()
+                        self.mostrar("Usuario", comando)
+                        
+                        # Procesar comando en paralelo
+                        self.executor.submit(self.procesar_comando, comando, traza)
+                    
+                time.sleep(0.1)  # Pequeña pausa para no saturar la CPU
+                
+            except Exception as e:
+                print(f"Error en loop principal: {e}")
+                time.sleep(1)
+    
+    def medir_activacion(self, inicio, aviso):
+        """Registra cuánto tarda EVA en quedar lista para el comando tras activarse
+
+        Se llama justo antes de empezar a escuchar el comando. La escucha solo
+        usa el umbral normal cuando el aviso (tono o saludo) deja de sonar, así
+        que EVA está lista en el último de esos dos momentos, en ambos modos.
+        """
+        def medir():
+            aviso.wait()  # Si ya terminó de sonar, vuelve enseguida: lista al empezar a escuchar
+            ESTADISTICAS.registrar("activacion_a_escucha_ms", (time.time() - inicio) * 1000)
+        
+        threading.Thread(target=medir, daemon=True).start()
+    
+    def procesar_comando(self, comando, traza=None):
+        """Procesa comandos con las intenciones de los grupos registrados
+
+        Si ninguna frase coincide exactamente se usa el clasificador aproximado.
+        Devuelve un diccionario con la intención, la respuesta y el error (si hubo).
+        La traza de la interacción se cierra cuando empieza a sonar la respuesta.
+        """
+        traza = traza or TRAZAS.nueva()
+        resultado = {"comando": comando, "intencion": None, "confianza": 0.0,
+                     "aproximada": False, "respuesta": None, "error": None}
+        try:
+            with traza.etapa("intencion"):
+                coincidencia = REGISTRO.interpretar(comando)
+            if coincidencia:
+                resultado["intencion"] = coincidencia.nombre
+                resultado["confianza"] = coincidencia.confianza
+                resultado["aproximada"] = coincidencia.aproximada
+                if coincidencia.aproximada:
+                    ESTADISTICAS.registrar("intenciones_aproximadas", coincidencia.confianza)
+                manejador = REGISTRO.manejador(coincidencia.nombre)
+                with traza.etapa("manejador"):
+                    if manejador:
+                        respuesta = manejador(self, comando, **coincidencia.slots)
+                    else:
+                        respuesta = getattr(self, f"comando_{coincidencia.nombre}")(comando, **coincidencia.slots)
+            else:
+                respuesta = "Comando no reconocido"
+            resultado["respuesta"] = respuesta
+            
+            # Los manejadores que responden por su cuenta devuelven None
+            if respuesta is None:
+                traza.finalizar()
+                return resultado
+            
+            # Responder y actualizar UI
+            self.mostrar("EVA", respuesta)
+            if respuesta != "Comando no reconocido":
+                hablar(respuesta, traza=traza)
+            else:
+                traza.finalizar()
+            
+        except Exception as e:
+            resultado["error"] = str(e)
+            self.mostrar("Sistema", f"Error procesando comando: {str(e)}")
+            hablar("Hubo un error procesando tu comando", traza=traza)
+        return resultado
+    
+    def avisar(self, mensaje, tipo="EVA"):
+        """Muestra (y si es de EVA, dice) un mensaje desde cualquier hilo"""
+        self.mostrar(tipo, mensaje)
+        if tipo == "EVA":
+            hablar(mensaje)
+    
+    def preguntar(self, pregunta, aviso=None, timeout=10):
+        """Hace una pregunta en voz alta y devuelve la respuesta transcrita"""
+        self.mostrar("EVA", aviso or pregunta)
+        hablar(pregunta, esperar=True)
+        return escuchar_comando_optimizado(timeout=timeout)
+    
+    # --- MANEJADORES PROPIOS DEL ASISTENTE ---
+    # Los demás comandos viven en los grupos del paquete comandos
     
-    threading.Thread(target=mostrar_recordatorio, daemon=True).start()
-    return f"Recordatorio creado para {minutos} minutos"
+    def comando_salir(self, comando):
+        self.modo_conversacion = False
+        return "De acuerdo, volviendo a modo pasivo"
+    
+    def comando_entrenar_activacion(self, comando):
+        self.entrenar_palabra_activacion()
+    
+    def comando_saludo(self, comando):
+        return "¡Hola! ¿En qué puedo ayudarte hoy?"
+    
+    def comando_gracias(self, comando):
+        return "De nada, siempre es un placer ayudarte"
+    
+    def comando_como_estas(self, comando):
+        return "Estoy funcionando perfectamente y listo para ayudarte"
+    
+    def comando_estadisticas(self, comando):
+        self.mostrar("Sistema", "⏱️ Latencia por etapa (ms):\n" + TRAZAS.texto())
+        percentiles = TRAZAS.percentiles()
+        if not percentiles:
+            return "Todavía no he medido ninguna interacción"
+        etapas = {k: v for k, v in percentiles.items() if k != "total"}
+        lenta = max(etapas, key=lambda k: etapas[k]["p50"]) if etapas else None
+        respuesta = ""
+        if "total" in percentiles:
+            total = percentiles["total"]
+            respuesta = (f"Respondo en {total['p50']:.0f} milisegundos de mediana, "
+                         f"{total['p95']:.0f} en el percentil 95. ")
+        if lenta:
+            respuesta += f"La etapa más lenta es {lenta}, con {etapas[lenta]['p50']:.0f} milisegundos"
+        return respuesta.strip()
+    
+    def entrenar_palabra_activacion(self, muestras=3):
+        """Graba varias veces la palabra de activación para el detector local"""
+        def proceso_entrenamiento():
+            grabaciones = []
+            for i in range(muestras):
+                self.mostrar("EVA", f"Di '{PALABRA_ACTIVACION}' ({i + 1} de {muestras})")
+                hablar(f"Di {PALABRA_ACTIVACION}", esperar=True)
+                try:
+                    grabaciones.append(escuchar_audio(timeout=5, phrase_time_limit=2))
+                except Exception:
+                    continue
+            
+            try:
+                DETECTOR_PALABRA.entrenar(PALABRA_ACTIVACION, grabaciones)
+                mensaje = f"Listo, ya reconozco '{PALABRA_ACTIVACION}' sin conexión"
+            except Exception as e:
+                mensaje = f"No pude aprender la palabra de activación: {str(e)}"
+            self.mostrar("EVA", mensaje)
+            hablar(mensaje)
+        
+        threading.Thread(target=proceso_entrenamiento, daemon=True).start()
 
 # --- INTERFAZ GRÁFICA MODERNA ---
 
-class AsistenteEVA:
-    def __init__(self):
+class AsistenteEVA(NucleoEVA):
+    def __init__(self, motor="google", ruta_modelo=None):
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
         
@@ -196,16 +500,18 @@ class AsistenteEVA:
         self.root.geometry("900x700")
         self.root.resizable(True, True)
         
-        self.asistente_activo = False
-        self.modo_conversacion = False
-        self.ultimo_comando_tiempo = 0
-        
+        super().__init__()
         self.setup_ui()
-        self.setup_executor()
-        
-    def setup_executor(self):
-        """Configura el executor para tareas paralelas"""
-        self.executor = ThreadPoolExecutor(max_workers=3)
+        self.iniciar_componentes(motor, ruta_modelo)
+    
+    def mostrar(self, tipo, mensaje):
+        self.root.after(0, lambda: self.agregar_mensaje(tipo, mensaje))
+    
+    def mostrar_estado(self, texto):
+        self.root.after(0, lambda: self.status_label.configure(text=texto))
+    
+    def indicador_audio(self, activo):
+        self.root.after(0, lambda: self.mostrar_indicador_audio(activo))
         
     def setup_ui(self):
         # Frame principal con gradiente simulado
@@ -228,7 +534,7 @@ class AsistenteEVA:
         status_frame = ctk.CTkFrame(self.main_frame)
         status_frame.pack(fill="x", padx=20, pady=10)
         
-        self.status_label = ctk.CTkLabel(status_frame, text="🔴 Estado: Inactivo", 
+        self.status_label = ctk.CTkLabel(status_frame, text="⏳ Estado: Iniciando voz y micrófono...", 
                                         font=ctk.CTkFont(size=18, weight="bold"))
         self.status_label.pack(pady=10)
         
@@ -247,6 +553,10 @@ class AsistenteEVA:
                                       font=ctk.CTkFont(size=12))
         self.info_label.pack(pady=5)
         
+        self.graficas_canvas = tk.Canvas(info_frame, height=60, bg="#2b2b2b", highlightthickness=0)
+        self.graficas_canvas.pack(fill="x", padx=10, pady=(0, 5))
+        self.graficas = graficas_sistema.GraficasSistema(self.graficas_canvas)
+        
         # Log de conversación mejorado
         log_frame = ctk.CTkFrame(self.main_frame)
         log_frame.pack(fill="both", expand=True, padx=20, pady=10)
@@ -285,6 +595,8 @@ class AsistenteEVA:
                      command=self.abrir_configuracion).pack(side="left", padx=2)
         ctk.CTkButton(button_frame2, text="📊 Sistema", 
                      command=self.mostrar_info_sistema).pack(side="left", padx=2)
+        ctk.CTkButton(button_frame2, text="📈 Estadísticas", 
+                     command=self.mostrar_estadisticas).pack(side="left", padx=2)
         ctk.CTkButton(button_frame2, text="🧹 Limpiar", 
                      command=self.limpiar_log).pack(side="left", padx=2)
         ctk.CTkButton(button_frame2, text="💾 Guardar", 
@@ -321,6 +633,9 @@ class AsistenteEVA:
         """Actualiza la información del sistema cada 5 segundos"""
         try:
             info = obtener_info_sistema()
+            ruido = CAPTURA.estimador
+            if ruido.piso is not None:
+                info += f" | 🎙️ Ruido {ruido.piso:.0f}, umbral {ruido.umbral:.0f}"
             self.info_label.configure(text=f"💻 {info}")
         except:
             self.info_label.configure(text="💻 Sistema: Error al obtener datos")
@@ -346,7 +661,10 @@ class AsistenteEVA:
         if not self.asistente_activo:
             self.asistente_activo = True
             self.start_button.configure(text="⏹️ Detener EVA")
-            self.status_label.configure(text="🟢 Estado: Activo - Escuchando...")
+            if self.componentes_listos.is_set():
+                self.status_label.configure(text="🟢 Estado: Activo - Escuchando...")
+            else:
+                self.status_label.configure(text="⏳ Estado: Activo - Esperando el micrófono...")
             self.agregar_mensaje("Sistema", "EVA iniciado correctamente")
             
             # Iniciar en hilo separado
@@ -373,245 +691,6 @@ class AsistenteEVA:
             else:
                 self.agregar_mensaje("Sistema", "No se detectó comando")
     
-    def ejecutar_asistente_loop(self):
-        """Loop principal del asistente optimizado"""
-        hablar("EVA activado y listo para ayudar", priority=True)
-        
-        while self.asistente_activo:
-            try:
-                # Escuchar palabra de activación
-                if not self.modo_conversacion:
-                    self.root.after(0, lambda: self.status_label.configure(
-                        text=f"🟡 Esperando '{PALABRA_ACTIVACION}'..."))
-                    
-                    comando = escuchar_comando_optimizado(timeout=2)
-                    
-                    if comando and PALABRA_ACTIVACION in comando:
-                        self.modo_conversacion = True
-                        self.ultimo_comando_tiempo = time.time()
-                        
-                        self.root.after(0, lambda: self.agregar_mensaje("Usuario", comando))
-                        self.root.after(0, lambda: self.status_label.configure(
-                            text="🟢 Modo conversación activo"))
-                        
-                        hablar("Hola, ¿en qué puedo ayudarte?", priority=True)
-                        continue
-                
-                # Modo conversación activo
-                if self.modo_conversacion:
-                    if time.time() - self.ultimo_comando_tiempo > CONVERSATION_TIMEOUT:
-                        self.modo_conversacion = False
-                        hablar("Volviendo a modo pasivo")
-                        continue
-                    
-                    self.root.after(0, lambda: self.mostrar_indicador_audio(True))
-                    comando = escuchar_comando_optimizado(timeout=8)
-                    self.root.after(0, lambda: self.mostrar_indicador_audio(False))
-                    
-                    if comando:
-                        self.ultimo_comando_tiempo = time.time()
-                        self.root.after(0, lambda: self.agregar_mensaje("Usuario", comando))
-                        
-                        # Procesar comando en paralelo
-                        self.executor.submit(self.procesar_comando, comando)
-                    
-                time.sleep(0.1)  # Pequeña pausa para no saturar la CPU
-                
-            except Exception as e:
-                print(f"Error en loop principal: {e}")
-                time.sleep(1)
-    
-    def procesar_comando(self, comando):
-        """Procesa comandos de forma ultra rápida"""
-        try:
-            respuesta = "Comando no reconocido"
-            
-            # Búsquedas (ultra rápidas)
-            if "busca en youtube" in comando or "busca en youtube" in comando.lower():
-                query = comando.replace("busca en youtube", "").strip()
-                if query:
-                    buscar_youtube_rapido(query)
-                    respuesta = f"Buscando '{query}' en YouTube"
-                else:
-                    respuesta = "¿Qué quieres buscar en YouTube?"
-            
-            elif "busca" in comando and "google" in comando:
-                query = comando.replace("busca", "").replace("google", "").strip()
-                if query:
-                    buscar_google_rapido(query)
-                    respuesta = f"Buscando '{query}' en Google"
-            
-            elif "busca" in comando:
-                query = comando.replace("busca", "").strip()
-                if query:
-                    buscar_google_rapido(query)
-                    respuesta = f"Buscando '{query}' en Google"
-            
-            # Comandos de salida
-            if any(word in comando for word in ["detente", "para", "adiós", "terminar"]):
-                self.modo_conversacion = False
-                respuesta = "De acuerdo, volviendo a modo pasivo"
-            
-            # Información del sistema (ultra rápido)
-            elif "sistema" in comando or "información" in comando:
-                respuesta = obtener_info_sistema()
-            
-            # Aplicaciones (apertura instantánea)
-            elif "calculadora" in comando:
-                if abrir_app_rapido("calculadora"):
-                    respuesta = "Calculadora abierta"
-                else:
-                    respuesta = "No pude abrir la calculadora"
-            
-            elif "notepad" in comando or "bloc de notas" in comando:
-                if abrir_app_rapido("notepad"):
-                    respuesta = "Bloc de notas abierto"
-            
-            elif "explorador" in comando or "archivos" in comando:
-                if abrir_app_rapido("explorador"):
-                    respuesta = "Explorador de archivos abierto"
-            
-            elif "administrador" in comando or "tareas" in comando:
-                if abrir_app_rapido("administrador"):
-                    respuesta = "Administrador de tareas abierto"
-            
-            # Control de volumen
-            elif "subir volumen" in comando or "aumentar volumen" in comando:
-                controlar_volumen("subir")
-                respuesta = "Volumen aumentado"
-            
-            elif "bajar volumen" in comando or "disminuir volumen" in comando:
-                controlar_volumen("bajar")
-                respuesta = "Volumen disminuido"
-            
-            elif "silenciar" in comando:
-                controlar_volumen("silenciar")
-                respuesta = "Audio silenciado"
-            
-            # Favoritos
-            elif "reproduce" in comando or "pon" in comando:
-                encontrado = False
-                for nombre, url in FAVORITOS.items():
-                    if nombre.lower() in comando:
-                        threading.Thread(target=lambda: webbrowser.open(url), daemon=True).start()
-                        respuesta = f"Reproduciendo {nombre}"
-                        encontrado = True
-                        break
-                if not encontrado:
-                    respuesta = "No encontré ese favorito"
-            
-            # Clima
-            elif "clima" in comando or "tiempo" in comando:
-                respuesta = obtener_clima_rapido()
-            
-            # Recordatorios
-            elif "recordar" in comando or "recordatorio" in comando:
-                respuesta = "Los recordatorios están en desarrollo"
-            
-            # Hora actual
-            elif "hora" in comando or "qué hora es" in comando:
-                hora_actual = datetime.now().strftime("%H:%M")
-                respuesta = f"Son las {hora_actual}"
-            
-            # Fecha actual
-            elif "fecha" in comando or "qué día es" in comando:
-                fecha_actual = datetime.now().strftime("%d de %B de %Y")
-                respuesta = f"Hoy es {fecha_actual}"
-            
-            # Comprimir imágenes (mejorado)
-            elif "comprimir" in comando and "imágenes" in comando:
-                self.comprimir_imagenes_rapido()
-                return
-            
-            # Apagar equipo
-            elif "apagar" in comando and "equipo" in comando:
-                respuesta = "¿Estás seguro? Di 'confirmar apagado' para continuar"
-            
-            elif "confirmar apagado" in comando:
-                respuesta = "Apagando equipo en 10 segundos..."
-                if platform.system() == "Windows":
-                    os.system("shutdown /s /t 10")
-            
-            # Responder y actualizar UI
-            self.root.after(0, lambda: self.agregar_mensaje("EVA", respuesta))
-            if respuesta != "Comando no reconocido":
-                hablar(respuesta)
-            
-        except Exception as e:
-            error_msg = f"Error procesando comando: {str(e)}"
-            self.root.after(0, lambda: self.agregar_mensaje("Sistema", error_msg))
-            hablar("Hubo un error procesando tu comando")
-    
-    def comprimir_imagenes_rapido(self):
-        """Compresión de imágenes optimizada"""
-        def proceso_compresion():
-            self.root.after(0, lambda: self.agregar_mensaje("EVA", "¿En qué carpeta? (escritorio, descargas, imágenes)"))
-            hablar("¿En qué carpeta quieres comprimir? Escritorio, descargas o imágenes")
-            
-            respuesta = escuchar_comando_optimizado(timeout=10)
-            if not respuesta:
-                return
-            
-            directorios = {
-                "escritorio": os.path.join(os.path.expanduser('~'), "Desktop"),
-                "descargas": os.path.join(os.path.expanduser('~'), "Downloads"),
-                "imágenes": os.path.join(os.path.expanduser('~'), "Pictures")
-            }
-            
-            carpeta_elegida = None
-            for nombre, ruta in directorios.items():
-                if nombre in respuesta:
-                    carpeta_elegida = ruta
-                    break
-            
-            if not carpeta_elegida:
-                self.root.after(0, lambda: self.agregar_mensaje("EVA", "No reconocí la carpeta"))
-                hablar("No reconocí esa carpeta")
-                return
-            
-            # Proceso de compresión en paralelo
-            def comprimir():
-                try:
-                    ruta_salida = os.path.join(carpeta_elegida, "comprimidas")
-                    if not os.path.exists(ruta_salida):
-                        os.makedirs(ruta_salida)
-                    
-                    count = 0
-                    archivos = [f for f in os.listdir(carpeta_elegida) 
-                               if f.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp'))]
-                    
-                    with ThreadPoolExecutor(max_workers=4) as executor:
-                        futures = []
-                        for archivo in archivos:
-                            future = executor.submit(self.comprimir_imagen_individual, 
-                                                   carpeta_elegida, archivo, ruta_salida)
-                            futures.append(future)
-                        
-                        for future in futures:
-                            if future.result():
-                                count += 1
-                    
-                    mensaje = f"¡Listo! Comprimí {count} imágenes" if count > 0 else "No encontré imágenes para comprimir"
-                    self.root.after(0, lambda: self.agregar_mensaje("EVA", mensaje))
-                    hablar(mensaje)
-                    
-                except Exception as e:
-                    error_msg = f"Error en compresión: {str(e)}"
-                    self.root.after(0, lambda: self.agregar_mensaje("Sistema", error_msg))
-        
-        threading.Thread(target=proceso_compresion, daemon=True).start()
-    
-    def comprimir_imagen_individual(self, carpeta_origen, archivo, carpeta_destino):
-        """Comprime una imagen individual"""
-        try:
-            ruta_completa = os.path.join(carpeta_origen, archivo)
-            with Image.open(ruta_completa) as img:
-                img.save(os.path.join(carpeta_destino, archivo), 
-                        optimize=True, quality=85)
-            return True
-        except:
-            return False
-    
     def abrir_configuracion(self):
         """Ventana de configuración"""
         config_window = ctk.CTkToplevel(self.root)
@@ -635,6 +714,16 @@ class AsistenteEVA:
         self.sensibilidad_slider.set(ENERGY_THRESHOLD)
         self.sensibilidad_slider.pack(pady=5)
         
+        # Confirmación con tono en lugar de saludo hablado
+        self.earcon_switch = ctk.CTkSwitch(config_window, text="Responder con tono al activarse")
+        if MODO_EARCON:
+            self.earcon_switch.select()
+        self.earcon_switch.pack(pady=(20, 0))
+        
+        # Grabación de muestras para el detector local
+        ctk.CTkButton(config_window, text="🎙️ Grabar palabra de activación",
+                     command=self.entrenar_palabra_activacion).pack(pady=(20, 0))
+        
         # Botones
         button_frame = ctk.CTkFrame(config_window, fg_color="transparent")
         button_frame.pack(pady=20)
@@ -646,7 +735,7 @@ class AsistenteEVA:
     
     def guardar_configuracion(self, window):
         """Guarda la configuración"""
-        global PALABRA_ACTIVACION, ENERGY_THRESHOLD
+        global PALABRA_ACTIVACION, ENERGY_THRESHOLD, MODO_EARCON
         
         nueva_palabra = self.palabra_entry.get().strip().lower()
         if nueva_palabra:
@@ -654,6 +743,8 @@ class AsistenteEVA:
         
         ENERGY_THRESHOLD = int(self.sensibilidad_slider.get())
         listener.energy_threshold = ENERGY_THRESHOLD
+        CAPTURA.estimador.umbral_minimo = ENERGY_THRESHOLD
+        MODO_EARCON = bool(self.earcon_switch.get())
         
         self.agregar_mensaje("Sistema", "Configuración guardada correctamente")
         window.destroy()
@@ -676,16 +767,43 @@ class AsistenteEVA:
         except Exception as e:
             self.agregar_mensaje("Sistema", f"Error guardando log: {str(e)}")
     
+    def mostrar_estadisticas(self):
+        """Panel con la latencia por etapa y las métricas acumuladas (se actualiza solo)"""
+        if getattr(self, "panel_estadisticas", None) and self.panel_estadisticas.winfo_exists():
+            self.panel_estadisticas.lift()
+            return
+        
+        self.panel_estadisticas = ctk.CTkToplevel(self.root)
+        self.panel_estadisticas.title("📈 Estadísticas de EVA")
+        self.panel_estadisticas.geometry("520x480")
+        self.panel_estadisticas.transient(self.root)
+        
+        texto = ctk.CTkTextbox(self.panel_estadisticas, font=ctk.CTkFont(family="Courier", size=13))
+        texto.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        def refrescar():
+            if not self.panel_estadisticas.winfo_exists():
+                return
+            texto.configure(state="normal")
+            texto.delete("1.0", "end")
+            texto.insert("end", "⏱️ Latencia por etapa (ms)\n\n" + TRAZAS.texto())
+            texto.insert("end", "\n\n📈 Métricas acumuladas\n\n" + ESTADISTICAS.texto())
+            texto.configure(state="disabled")
+            self.panel_estadisticas.after(2000, refrescar)
+        
+        refrescar()
+    
     def mostrar_info_sistema(self):
         """Muestra información detallada del sistema"""
         try:
+            muestra = MONITOR.ultima()
             info = f"""
 💻 Información del Sistema:
-- CPU: {psutil.cpu_percent(interval=1):.1f}%
-- RAM: {psutil.virtual_memory().percent:.1f}%
-- Disco: {psutil.disk_usage('/').percent:.1f}%
-- Procesos: {len(psutil.pids())}
-- Red: {'Conectado' if psutil.net_if_stats() else 'Desconectado'}
+- CPU: {muestra['cpu']:.1f}%
+- RAM: {muestra['ram']:.1f}%
+- Disco: {muestra['disco']:.1f}%
+- Procesos: {muestra['procesos']:.0f}
+- Red: {'Conectado' if muestra['interfaces'] else 'Desconectado'} (↑ {muestra['red_enviado_kbps']:.0f} KB/s, ↓ {muestra['red_recibido_kbps']:.0f} KB/s)
 - Sistema: {platform.system()} {platform.release()}
             """
             self.agregar_mensaje("Sistema", info.strip())
@@ -701,345 +819,119 @@ class AsistenteEVA:
            print("EVA terminado por el usuario")
        finally:
            self.executor.shutdown(wait=False)
+           CAPTURA.detener()
+           VOZ.detener()
 
-# --- FUNCIONES ADICIONALES RÁPIDAS ---
-
-def obtener_noticias_rapido():
-   """Obtiene noticias de forma rápida"""
-   try:
-       # Simulación de noticias - puedes integrar una API real
-       noticias = [
-           "Tecnología: Nuevos avances en IA",
-           "Ciencia: Descubrimiento espacial",
-           "Deportes: Resultados del día"
-       ]
-       return "Últimas noticias: " + ", ".join(noticias[:2])
-   except:
-       return "No pude obtener las noticias"
+# --- MODO DAEMON ---
 
-def traducir_texto_rapido(texto, idioma_destino="en"):
-   """Traducción rápida básica"""
-   traducciones_basicas = {
-       "hola": {"en": "hello", "fr": "bonjour"},
-       "gracias": {"en": "thank you", "fr": "merci"},
-       "adiós": {"en": "goodbye", "fr": "au revoir"}
-   }
+def ejecutar_daemon(args):
+   """Bucle de escucha y servidor de comandos por socket, sin Tk"""
+   import signal
+   from servidor_ipc import RUTA_SOCKET, ServidorComandos
    
-   texto_lower = texto.lower()
-   if texto_lower in traducciones_basicas:
-       return traducciones_basicas[texto_lower].get(idioma_destino, texto)
-   return f"Traducción de '{texto}' no disponible"
-
-def calcular_rapido(expresion):
-   """Calculadora rápida para operaciones básicas"""
-   try:
-       # Limpieza básica de seguridad y normalización de operadores
-       expresion = expresion.replace('entre', '/').replace('dividido', '/')
-       expresion_limpia = ''.join(c for c in expresion if c in '0123456789+-*/()., ')
-       resultado = eval(expresion_limpia)
-       return f"El resultado es {resultado}"
-   except:
-       return "No pude realizar el cálculo"
-
-def reproducir_musica_local():
-   """Reproduce música local"""
-   import glob
+   nucleo = NucleoEVA()
+   nucleo.iniciar_componentes(args.reconocedor, args.modelo,
+                              voz=VOZ_ACTIVA, microfono=not args.sin_microfono)
+   if not args.sin_microfono:
+       nucleo.asistente_activo = True
+       threading.Thread(target=nucleo.ejecutar_asistente_loop, daemon=True).start()
    
+   servidor = ServidorComandos(nucleo.procesar_comando, args.socket or RUTA_SOCKET)
+   # SIGTERM cierra igual que Ctrl+C; shutdown() debe llamarse desde otro hilo
+   signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=servidor.shutdown).start())
+   print(f"🔌 EVA escuchando comandos en {servidor.ruta}")
    try:
-       # Buscar archivos de música en carpetas comunes
-       rutas_musica = [
-           os.path.join(os.path.expanduser('~'), "Music", "*.mp3"),
-           os.path.join(os.path.expanduser('~'), "Música", "*.mp3"),
-           os.path.join(os.path.expanduser('~'), "Downloads", "*.mp3")
-       ]
-       
-       archivos_musica = []
-       for ruta in rutas_musica:
-           archivos_musica.extend(glob.glob(ruta))
-       
-       if archivos_musica:
-           archivo_aleatorio = archivos_musica[0]  # Tomar el primero por simplicidad
-           if platform.system() == "Windows":
-               os.startfile(archivo_aleatorio)
-           elif platform.system() == "Darwin":
-               subprocess.call(["open", archivo_aleatorio])
-           else:
-               subprocess.call(["xdg-open", archivo_aleatorio])
-           return "Reproduciendo música local"
-       else:
-           return "No encontré archivos de música"
-   except:
-       return "Error reproduciendo música"
-
-def crear_nota_rapida(contenido):
-   """Crea una nota rápida"""
-   try:
-       if not contenido:
-           return "¿Qué quieres que anote?"
-           
-       timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-       filename = f"nota_eva_{timestamp}.txt"
-       
-       with open(filename, 'w', encoding='utf-8') as f:
-           f.write(f"Nota creada por EVA - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-           f.write("="*50 + "\n\n")
-           f.write(contenido)
-       
-       return f"Nota guardada como {filename}"
-   except:
-       return "Error creando la nota"
-
-def organizar_descargas_rapido():
-   """Organiza la carpeta de descargas por tipo de archivo"""
-   try:
-       home = os.path.expanduser('~')
-       possible_dirs = ["Downloads", "Descargas"]
-       downloads_path = None
-       for d in possible_dirs:
-           p = os.path.join(home, d)
-           if os.path.exists(p):
-               downloads_path = p
-               break
-       if not downloads_path:
-           return "No encontré la carpeta de descargas"
-       
-       tipos_archivo = {
-           'Imágenes': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', '.ico'],
-           'Documentos': ['.pdf', '.doc', '.docx', '.txt', '.rtf', '.odt', '.xls', '.xlsx', '.csv'],
-           'Videos': ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv'],
-           'Audio': ['.mp3', '.wav', '.flac', '.aac', '.ogg'],
-           'Programas': ['.exe', '.msi', '.dmg', '.deb', '.rpm'],
-           'Comprimidos': ['.zip', '.rar', '.7z', '.tar', '.gz'],
-           'Carpetas': []  # mover subcarpetas
-       }
-       
-       archivos_movidos = 0
-       
-       # Listar todo el contenido (archivos y carpetas)
-       items = os.listdir(downloads_path)
-       
-       for filename in items:
-           ruta_item = os.path.join(downloads_path, filename)
-           if os.path.isdir(ruta_item):
-               # mover carpetas enteras a "Carpetas"
-               carpeta_dest = os.path.join(downloads_path, 'Carpetas')
-               if not os.path.exists(carpeta_dest):
-                   os.makedirs(carpeta_dest)
-               destino = os.path.join(carpeta_dest, filename)
-               try:
-                   os.rename(ruta_item, destino)
-                   archivos_movidos += 1
-               except:
-                   pass
-               continue
-           
-           carpeta_dest = os.path.join(downloads_path, 'Carpetas')
-           if not os.path.exists(carpeta_dest):
-               os.makedirs(carpeta_dest)
-           destino = os.path.join(carpeta_dest, filename)
-           try:
-               os.rename(ruta_item, destino)
-               archivos_movidos += 1
-           except:
-               pass
-           continue
-
-           extension = os.path.splitext(filename)[1].lower()
-           
-           for tipo, extensiones in tipos_archivo.items():
-               if extension in extensiones:
-                   # Crear carpeta si no existe
-                   carpeta_tipo = os.path.join(downloads_path, tipo)
-                   if not os.path.exists(carpeta_tipo):
-                       os.makedirs(carpeta_tipo)
-                   
-                   # Mover archivo
-                   origen = os.path.join(downloads_path, filename)
-                   destino = os.path.join(carpeta_tipo, filename)
-                   
-                   # Si el archivo ya existe en destino, agregar número
-                   if os.path.exists(destino):
-                       base, ext = os.path.splitext(filename)
-                       i = 1
-                       while os.path.exists(destino):
-                           nuevo_nombre = f"{base}_{i}{ext}"
-                           destino = os.path.join(carpeta_tipo, nuevo_nombre)
-                           i += 1
-                   
-                   try:
-                       os.rename(origen, destino)
-                       archivos_movidos += 1
-                   except:
-                       continue
-                   break
-       
-       return f"Organizadas las descargas. {archivos_movidos} archivos movidos"
-   except Exception as e:
-       return f"Error organizando descargas: {str(e)}"
-
-def backup_rapido():
-   """Crea un backup rápido de documentos importantes"""
-   try:
-       timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-       backup_folder = os.path.join(os.path.expanduser('~'), f"Backup_EVA_{timestamp}")
-       
-       if not os.path.exists(backup_folder):
-           os.makedirs(backup_folder)
-       
-       # Carpetas importantes para backup
-       carpetas_importantes = [
-           os.path.join(os.path.expanduser('~'), "Documents"),
-           os.path.join(os.path.expanduser('~'), "Desktop")
-       ]
-       
-       archivos_copiados = 0
-       
-       import shutil  # Asegurar import
-       
-       for carpeta in carpetas_importantes:
-           if os.path.exists(carpeta):
-               carpeta_nombre = os.path.basename(carpeta)
-               destino_carpeta = os.path.join(backup_folder, carpeta_nombre)
-
-               # Copiar recursivamente todo el contenido manteniendo la estructura
-               for root_dir, dirs, files in os.walk(carpeta):
-                   rel_path = os.path.relpath(root_dir, carpeta)
-                   destino_dir_actual = os.path.join(destino_carpeta, rel_path)
-                   if not os.path.exists(destino_dir_actual):
-                       os.makedirs(destino_dir_actual)
-
-                   for archivo in files:
-                       origen_archivo = os.path.join(root_dir, archivo)
-                       destino_archivo = os.path.join(destino_dir_actual, archivo)
-                       try:
-                           shutil.copy2(origen_archivo, destino_archivo)
-                           archivos_copiados += 1
-                       except:
-                           continue
-       
-       # Crear ZIP del backup
-       import zipfile
-       zip_path = f"{backup_folder}.zip"
-       with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-           for root, dirs, files in os.walk(backup_folder):
-               for file in files:
-                   file_path = os.path.join(root, file)
-                   arcname = os.path.relpath(file_path, backup_folder)
-                   zipf.write(file_path, arcname)
-       
-       return f"Backup creado en {backup_folder} y comprimido en {zip_path}. {archivos_copiados} archivos respaldados"
-   except Exception as e:
-       return f"Error creando backup: {str(e)}"
-
-# --- EXTENSIÓN DE LA CLASE PRINCIPAL ---
-
-# Agregar estos métodos a la clase AsistenteEVA existente
-def agregar_comandos_adicionales(self, comando):
-   """Comandos adicionales para el procesador principal"""
-   
-   # Noticias
-   if "noticias" in comando:
-       respuesta = obtener_noticias_rapido()
-       return respuesta
-   
-   # Traducción
-   elif "traduce" in comando:
-       texto_a_traducir = comando.replace("traduce", "").strip()
-       if texto_a_traducir:
-           respuesta = traducir_texto_rapido(texto_a_traducir)
-       else:
-           respuesta = "¿Qué quieres que traduzca?"
-       return respuesta
-   
-   # Calculadora
-   elif "calcula" in comando or "cuánto es" in comando:
-       expresion = comando.replace("calcula", "").replace("cuánto es", "").strip()
-       if expresion:
-           respuesta = calcular_rapido(expresion)
-       else:
-           respuesta = "¿Qué quieres que calcule?"
-       return respuesta
-   
-   # Música local
-   elif "pon música" in comando or "reproduce música" in comando:
-       respuesta = reproducir_musica_local()
-       return respuesta
-   
-   # Crear nota
-   elif "crea una nota" in comando or "anota" in comando:
-       contenido = comando.replace("crea una nota", "").replace("anota", "").strip()
-       if contenido:
-           respuesta = crear_nota_rapida(contenido)
-       else:
-           respuesta = "¿Qué quieres anotar?"
-       return respuesta
+       servidor.serve_forever()
+   except KeyboardInterrupt:
+       print("EVA terminado por el usuario")
+   finally:
+       servidor.server_close()
+       nucleo.asistente_activo = False
+       nucleo.executor.shutdown(wait=False)
+       CAPTURA.detener()
+       VOZ.detener()
+
+# --- MODO LOTE ---
+
+def ejecutar_por_lotes(args, salida):
+   """Procesa órdenes de texto de un archivo o de stdin y resume sus latencias"""
+   from lote import ejecutar_lote
    
-   # Organizar descargas
-   elif "organiza descargas" in comando or "ordena descargas" in comando:
-       respuesta = organizar_descargas_rapido()
-       return respuesta
+   nucleo = NucleoEVA()
+   nucleo.iniciar_componentes(args.reconocedor, args.modelo, voz=VOZ_ACTIVA, microfono=False)
+   nucleo.componentes_listos.wait()
    
-   # Backup
-   elif "haz backup" in comando or "crear respaldo" in comando:
-       self.root.after(0, lambda: self.agregar_mensaje("EVA", "Iniciando respaldo, esto puede tardar unos minutos..."))
-       hablar("Iniciando respaldo, te avisaré al terminar")
-       def tarea_backup():
-           msg = backup_rapido()
-           self.root.after(0, lambda: self.agregar_mensaje("EVA", msg))
-           hablar(msg)
-       threading.Thread(target=tarea_backup, daemon=True).start()
-       return "Backup en progreso"
-   
-   # Comandos de cortesía
-   elif any(saludo in comando for saludo in ["hola", "buenos días", "buenas tardes", "buenas noches"]):
-       respuesta = "¡Hola! ¿En qué puedo ayudarte hoy?"
-       return respuesta
-   
-   elif "gracias" in comando:
-       respuesta = "De nada, siempre es un placer ayudarte"
-       return respuesta
-   
-   elif "cómo estás" in comando:
-       respuesta = "Estoy funcionando perfectamente y listo para ayudarte"
-       return respuesta
-   
-   return None
-
-# Modificar el método procesar_comando para incluir los nuevos comandos
-def procesar_comando_extendido(self, comando):
-   """Versión extendida del procesador de comandos"""
+   entrada = sys.stdin if args.lote == "-" else open(args.lote, 'r', encoding='utf-8')
    try:
-       # Primero intentar comandos adicionales
-       respuesta_adicional = agregar_comandos_adicionales(self, comando)
-       if respuesta_adicional:
-           self.root.after(0, lambda: self.agregar_mensaje("EVA", respuesta_adicional))
-           hablar(respuesta_adicional)
-           return
-       
-       # Si no hay respuesta adicional, usar el procesador original
-       self.procesar_comando_original(comando)
-       
-   except Exception as e:
-       error_msg = f"Error procesando comando: {str(e)}"
-       self.root.after(0, lambda: self.agregar_mensaje("Sistema", error_msg))
-       hablar("Hubo un error procesando tu comando")
+       resumen = ejecutar_lote(entrada, nucleo.procesar_comando, salida, args.concurrencia)
+   finally:
+       if entrada is not sys.stdin:
+           entrada.close()
+       nucleo.executor.shutdown(wait=False)
+       VOZ.detener()
+   
+   salida.write(json.dumps({"resumen": resumen}, ensure_ascii=False) + "\n")
+   print(f"📊 {resumen['comandos']} órdenes en {resumen['segundos']} s "
+         f"(p50 {resumen.get('p50_ms', 0)} ms, p95 {resumen.get('p95_ms', 0)} ms, "
+         f"p99 {resumen.get('p99_ms', 0)} ms, {resumen['errores']} errores)")
 
 # --- SCRIPT PRINCIPAL ---
 
 def main():
    """Función principal optimizada"""
+   global MODO_EARCON, VOZ_ACTIVA
+   parser = argparse.ArgumentParser(description="EVA - Asistente Virtual Avanzado")
+   parser.add_argument("--reconocedor", choices=MOTORES,
+                       default=os.environ.get("EVA_RECONOCEDOR", "google"),
+                       help="Motor de reconocimiento de voz")
+   parser.add_argument("--modelo", default=os.environ.get("EVA_MODELO"),
+                       help="Carpeta del modelo local (vosk/sphinx) o de las grabaciones (replay)")
+   parser.add_argument("--earcon", action="store_true",
+                       help="Confirmar la activación con un tono y escuchar el comando de inmediato")
+   parser.add_argument("--startup-profile", action="store_true",
+                       help="Mostrar el tiempo de importación de cada módulo al arrancar")
+   parser.add_argument("--daemon", action="store_true",
+                       help="Ejecutar sin ventana y recibir comandos de texto por un socket Unix")
+   parser.add_argument("--socket", default=os.environ.get("EVA_SOCKET"),
+                       help="Ruta del socket del modo daemon")
+   parser.add_argument("--lote", nargs="?", const="-", metavar="ARCHIVO",
+                       help="Ejecutar sin ventana las órdenes de un archivo (o de stdin), una por línea")
+   parser.add_argument("--concurrencia", type=int, default=1,
+                       help="Órdenes que se procesan a la vez en modo lote")
+   parser.add_argument("--simular", action="store_true",
+                       help="En modo lote o daemon, responder sin ejecutar los comandos (no abre, cierra ni borra nada)")
+   parser.add_argument("--sin-voz", action="store_true",
+                       help="No sintetizar las respuestas, solo mostrarlas")
+   parser.add_argument("--sin-microfono", action="store_true",
+                       help="No abrir el micrófono (el daemon solo atiende el socket)")
+   parser.add_argument("--muestreo", type=float, default=MONITOR.intervalo,
+                       help="Segundos entre muestras de CPU, RAM, disco y red")
+   args = parser.parse_args()
+   
+   MODO_EARCON = MODO_EARCON or args.earcon
+   VOZ_ACTIVA = not args.sin_voz
+   MONITOR.intervalo = args.muestreo
+   
+   # En modo lote stdout queda solo para las líneas JSON; los mensajes van a stderr
+   salida = sys.stdout
+   if args.lote:
+       sys.stdout = sys.stderr
+   
    print("🤖 Iniciando EVA - Asistente Virtual Avanzado")
    print("⚡ Cargando componentes...")
    
    try:
        # Verificar dependencias críticas
        required_modules = ['speech_recognition', 'pyttsx3', 'customtkinter', 'psutil']
+       if args.daemon or args.lote:
+           required_modules.remove('customtkinter')
+       if args.sin_voz:
+           required_modules.remove('pyttsx3')
        missing_modules = []
        
+       # find_spec solo busca el módulo; importarlo aquí duplicaría el costo del arranque
        for module in required_modules:
-           try:
-               __import__(module)
-           except ImportError:
+           if importlib.util.find_spec(module) is None:
                missing_modules.append(module)
        
        if missing_modules:
@@ -1048,16 +940,30 @@ def main():
            return
        
        print("✅ Todos los módulos están disponibles")
+       
+       if args.reconocedor != "google":
+           print(f"🎧 Reconocimiento con motor '{args.reconocedor}'")
+       if args.simular and (args.daemon or args.lote):
+           REGISTRO.simular()
+           print("🧪 Modo simulado: los comandos no tienen efectos")
+       if args.daemon:
+           ejecutar_daemon(args)
+           return
+       if args.lote:
+           ejecutar_por_lotes(args, salida)
+           return
        print("🚀 Iniciando interfaz gráfica...")
        
-       # Crear y ejecutar la aplicación
-       app = AsistenteEVA()
+       # La voz, el motor de reconocimiento y el micrófono se inician con la ventana ya visible
+       app = AsistenteEVA(motor=args.reconocedor, ruta_modelo=args.modelo)
        
-       # Parche para agregar los comandos adicionales
-       app.procesar_comando_original = app.procesar_comando
-       app.procesar_comando = lambda cmd: procesar_comando_extendido(app, cmd)
+       # Lo que no hace falta para la ventana se importa mientras el usuario empieza a hablar
+       precargar_en_segundo_plano()
        
        print("✅ EVA listo para usar!")
+       if args.startup_profile:
+           print(f"⏱️ Ventana lista en {(time.perf_counter() - INICIO_ARRANQUE) * 1000:.0f} ms")
+           print(perfil_importaciones())
        app.run()
        
    except Exception as e:
@@ -0,0 +1,123 @@
+"""Benchmark reproducible del pipeline de EVA sin micrófono, red ni voz
+
+Recorre una carpeta de grabaciones WAV (con sus transcripciones, en el
+formato del motor replay) y pasa cada una por escuchar_comando_optimizado y
+procesar_comando. Los manejadores se sustituyen por respuestas fijas para no
+abrir programas ni páginas. Uso:
+
+    python benchmark.py fixtures --repeticiones 5 --salida resultados.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+
+import speech_recognition as sr
+
+import asistente_v3 as eva
+from captura_audio import CapturaArchivo
+from comandos import REGISTRO
+from reconocimiento import ANCHO_CANONICO, FRECUENCIA_CANONICA
+from trazas import RegistroTrazas
+from voz import VozNula
+
+SILENCIO_FINAL = 1.0  # Segundos de silencio tras cada grabación para cerrar la frase
+
+
+def preparar(carpeta, velocidad):
+    """Conecta el asistente a la captura simulada, el motor replay y la voz nula"""
+    eva.CAPTURA = CapturaArchivo(eva.listener, velocidad=velocidad)
+    eva.CAPTURA.iniciar()
+    eva.VOZ = VozNula()
+    eva.configurar_reconocedor("replay", carpeta)
+    REGISTRO.simular()
+    return eva.NucleoEVA()
+
+
+def version_codigo():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def ejecutar(carpeta, repeticiones=1, velocidad=0.0):
+    nucleo = preparar(carpeta, velocidad)
+    grabaciones = eva.RECONOCEDOR.grabaciones
+    if not grabaciones:
+        raise SystemExit(f"No hay grabaciones con transcripción en '{carpeta}'")
+    silencio = b"\0" * int(SILENCIO_FINAL * eva.CAPTURA.frecuencia) * eva.CAPTURA.ancho_muestra
+
+    registro = RegistroTrazas(capacidad=len(grabaciones) * repeticiones)
+    resultados = []
+    segundos_audio = 0.0
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        for datos, esperado in grabaciones:
+            audio = sr.AudioData(datos, FRECUENCIA_CANONICA, ANCHO_CANONICO)
+            datos_captura = audio.get_raw_data(convert_rate=eva.CAPTURA.frecuencia,
+                                               convert_width=eva.CAPTURA.ancho_muestra)
+            segundos_audio += len(datos) / (FRECUENCIA_CANONICA * ANCHO_CANONICO)
+
+            traza = registro.nueva()
+            eva.CAPTURA.reproducir(datos_captura + silencio)
+            reconocido = eva.escuchar_comando_optimizado(timeout=5, traza=traza)
+            if reconocido:
+                resultado = nucleo.procesar_comando(reconocido, traza)
+            else:
+                traza.finalizar()
+                resultado = {"intencion": None, "error": "sin transcripción"}
+            resultados.append({"esperado": esperado, "reconocido": reconocido,
+                               "intencion": resultado["intencion"], "error": resultado["error"],
+                               "ms": {k: round(v, 3) for k, v in traza.duraciones.items()}})
+    segundos = time.perf_counter() - inicio
+    eva.CAPTURA.detener()
+
+    aciertos = sum((r["reconocido"] or "").lower() == r["esperado"].lower() for r in resultados)
+    return {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "version": version_codigo(),
+        "carpeta": os.path.abspath(carpeta),
+        "grabaciones": len(grabaciones),
+        "repeticiones": repeticiones,
+        "velocidad": velocidad,
+        "segundos": round(segundos, 3),
+        "interacciones_por_segundo": round(len(resultados) / segundos, 2),
+        "segundos_audio": round(segundos_audio, 3),
+        "factor_tiempo_real": round(segundos / segundos_audio, 4) if segundos_audio else None,
+        "transcripciones_correctas": aciertos,
+        "sin_intencion": sum(r["intencion"] is None for r in resultados),
+        "etapas": {nombre: {k: v if k == "muestras" else round(float(v), 3) for k, v in datos.items()}
+                   for nombre, datos in registro.percentiles().items()},
+        "interacciones": resultados,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del pipeline de EVA con grabaciones")
+    parser.add_argument("carpeta", help="Carpeta con .wav y sus transcripciones (.txt o transcripciones.json)")
+    parser.add_argument("--repeticiones", type=int, default=1, help="Veces que se recorre la carpeta")
+    parser.add_argument("--velocidad", type=float, default=0.0,
+                        help="Ritmo de la captura simulada (1.0 = tiempo real, 0 = sin esperas)")
+    parser.add_argument("--salida", help="Archivo JSON de resultados (por defecto, stdout)")
+    args = parser.parse_args()
+
+    # Los mensajes del asistente van a stderr para que stdout sea solo el JSON
+    with redirect_stdout(sys.stderr):
+        resultado = ejecutar(args.carpeta, args.repeticiones, args.velocidad)
+    texto = json.dumps(resultado, ensure_ascii=False, indent=2)
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            f.write(texto + "\n")
+        print(f"Resultados guardados en {args.salida}")
+    else:
+        print(texto)
+
+
+if __name__ == "__main__":
+    main()
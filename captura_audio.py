@@ -0,0 +1,323 @@
+import audioop
+import math
+import threading
+import time
+
+import speech_recognition as sr
+
+# --- CONFIGURACIÓN DE CAPTURA ---
+FRECUENCIA_MUESTREO = 16000
+TAMANO_BLOQUE = 1024  # Muestras por bloque leído del micrófono
+SEGUNDOS_BUFFER = 30  # Historial de audio que se conserva en memoria
+PRE_ROLL = 0.5  # Segundos previos al inicio de la voz que se incluyen en la frase
+MAXIMO_ATRASO = 5.0  # Segundos pendientes (dichos mientras se procesaba) que se recuperan al volver a escuchar
+UMBRAL_MINIMO = 100  # Umbral de energía por debajo del cual nunca se baja
+
+
+class BufferCircular:
+    """Buffer circular de bytes de tamaño fijo respaldado por un bytearray"""
+
+    def __init__(self, capacidad):
+        self.capacidad = capacidad
+        self._datos = bytearray(capacidad)
+        self.total = 0  # Bytes escritos desde el inicio (posición absoluta)
+        self._condicion = threading.Condition()
+
+    @property
+    def mas_antiguo(self):
+        """Posición absoluta del byte más antiguo todavía disponible"""
+        return max(0, self.total - self.capacidad)
+
+    def escribir(self, bloque):
+        """Agrega un bloque sobrescribiendo los datos más antiguos"""
+        n = len(bloque)
+        if n == 0:
+            return
+        if n > self.capacidad:
+            bloque = bloque[-self.capacidad:]
+        with self._condicion:
+            inicio = (self.total + n - len(bloque)) % self.capacidad
+            fin = inicio + len(bloque)
+            if fin <= self.capacidad:
+                self._datos[inicio:fin] = bloque
+            else:
+                corte = self.capacidad - inicio
+                self._datos[inicio:] = bloque[:corte]
+                self._datos[:fin - self.capacidad] = bloque[corte:]
+            self.total += n
+            self._condicion.notify_all()
+
+    def leer(self, desde, hasta=None):
+        """Devuelve los bytes entre dos posiciones absolutas"""
+        with self._condicion:
+            hasta = self.total if hasta is None else min(hasta, self.total)
+            desde = max(desde, self.mas_antiguo)
+            if desde >= hasta:
+                return b""
+            inicio = desde % self.capacidad
+            fin = inicio + (hasta - desde)
+            if fin <= self.capacidad:
+                return bytes(self._datos[inicio:fin])
+            return bytes(self._datos[inicio:]) + bytes(self._datos[:fin - self.capacidad])
+
+    def esperar(self, posicion, timeout=None):
+        """Bloquea hasta que existan datos más allá de la posición indicada"""
+        with self._condicion:
+            return self._condicion.wait_for(lambda: self.total > posicion, timeout)
+
+
+class EstimadorRuido:
+    """Piso de ruido continuo que ajusta el umbral de energía del reconocedor"""
+
+    def __init__(self, reconocedor, segundos_bloque, umbral_minimo=UMBRAL_MINIMO,
+                 constante_bajada=0.5, constante_subida=5.0):
+        self.reconocedor = reconocedor
+        self.umbral_minimo = umbral_minimo
+        self.piso = None  # Energía RMS estimada del ruido de fondo
+        self.nivel = 0  # Energía RMS del último bloque capturado
+        # El piso baja rápido ante silencio y sube despacio ante ruido sostenido
+        self._alfa_bajada = math.exp(-segundos_bloque / constante_bajada)
+        self._alfa_subida = math.exp(-segundos_bloque / constante_subida)
+
+    def actualizar(self, energia):
+        """Incorpora la energía de un bloque en O(1) y recalcula el umbral"""
+        self.nivel = energia
+        if self.piso is None:
+            self.piso = float(energia)
+        elif energia < self.piso:
+            self.piso = self.piso * self._alfa_bajada + energia * (1 - self._alfa_bajada)
+        elif energia < self.umbral:
+            # Solo el audio que no parece voz eleva el piso
+            self.piso = self.piso * self._alfa_subida + energia * (1 - self._alfa_subida)
+        self.reconocedor.energy_threshold = self.umbral
+
+    @property
+    def umbral(self):
+        piso = self.piso or 0
+        return max(self.umbral_minimo, piso * self.reconocedor.dynamic_energy_ratio)
+
+
+class CapturaContinua:
+    """Mantiene un único flujo de micrófono abierto que alimenta un buffer circular"""
+
+    def __init__(self, reconocedor, frecuencia=FRECUENCIA_MUESTREO,
+                 tamano_bloque=TAMANO_BLOQUE, segundos_buffer=SEGUNDOS_BUFFER):
+        self.reconocedor = reconocedor  # sr.Recognizer con los umbrales de energía
+        self.frecuencia = frecuencia
+        self.tamano_bloque = tamano_bloque
+        self.ancho_muestra = 2  # sr.Microphone captura en paInt16
+        self.buffer = BufferCircular(frecuencia * self.ancho_muestra * segundos_buffer)
+        self.activa = False
+        self.ultima_posicion = 0  # Fin de la última frase extraída: ahí sigue la próxima escucha
+        self.en_eco = None  # Función que indica si EVA está hablando; ese audio no se vuelve a leer
+        self.fin_eco = 0  # Posición del último bloque capturado mientras EVA hablaba
+        self.estimador = EstimadorRuido(reconocedor, tamano_bloque / frecuencia)
+        self._lista = threading.Event()
+        self._hilo = None
+        self._lock = threading.Lock()
+
+    @property
+    def bytes_bloque(self):
+        return self.tamano_bloque * self.ancho_muestra
+
+    @property
+    def segundos_bloque(self):
+        return self.tamano_bloque / self.frecuencia
+
+    def iniciar(self, timeout=5):
+        """Abre el micrófono una sola vez (llamadas repetidas no hacen nada)"""
+        with self._lock:
+            if self.activa:
+                return
+            self._lista.clear()
+            self.activa = True
+            self._hilo = threading.Thread(target=self._bucle_captura, daemon=True)
+            self._hilo.start()
+        self._lista.wait(timeout)
+        if not self.activa:
+            raise OSError("No se pudo abrir el micrófono")
+
+    def detener(self):
+        """Cierra el flujo del micrófono"""
+        self.activa = False
+        if self._hilo:
+            self._hilo.join(timeout=1)
+
+    def _bucle_captura(self):
+        try:
+            microfono = sr.Microphone(sample_rate=self.frecuencia, chunk_size=self.tamano_bloque)
+            with microfono as fuente:
+                self.ancho_muestra = fuente.SAMPLE_WIDTH
+                self._lista.set()
+                while self.activa:
+                    self._agregar_bloque(fuente.stream.read(fuente.CHUNK))
+        except Exception as e:
+            print(f"Error en captura de audio: {e}")
+        finally:
+            self.activa = False
+            self._lista.set()
+
+    def _agregar_bloque(self, bloque):
+        self.buffer.escribir(bloque)
+        self.estimador.actualizar(audioop.rms(bloque, self.ancho_muestra))
+        if self.en_eco and self.en_eco():
+            self.fin_eco = self.buffer.total
+
+    def posicion_inicial(self):
+        """Dónde empieza la próxima escucha: tras la última frase extraída
+
+        Así no se pierde lo que el usuario dijo mientras se reconocía o
+        procesaba el comando anterior. Se saltan el audio grabado mientras
+        EVA hablaba (su propio eco) y lo que exceda MAXIMO_ATRASO.
+        """
+        atraso = int(MAXIMO_ATRASO * self.frecuencia) * self.ancho_muestra
+        return max(self.ultima_posicion, self.fin_eco, self.buffer.mas_antiguo, self.buffer.total - atraso)
+
+    def _siguiente_bloque(self, cursor, limite_espera):
+        """Lee el bloque que empieza en el cursor, esperando a que llegue"""
+        cursor = max(cursor, self.buffer.mas_antiguo)
+        if not self.buffer.esperar(cursor + self.bytes_bloque - 1, limite_espera):
+            return cursor, None
+        return cursor, self.buffer.leer(cursor, cursor + self.bytes_bloque)
+
+    def escuchar_frase(self, timeout=None, phrase_time_limit=None, pre_roll=PRE_ROLL, desde=None,
+                       al_bloque=None, umbral=None, al_inicio=None):
+        """Extrae la siguiente frase del buffer sin reabrir el micrófono
+
+        al_bloque, si se indica, recibe el audio de la frase a medida que llega
+        (None si lo recibido era ruido y se descarta) y puede devolver True
+        para dar la frase por terminada antes de la pausa final.
+        umbral es una función que devuelve el umbral de energía vigente (por
+        defecto el del reconocedor) y al_inicio se llama al detectar voz.
+        """
+        if umbral is None:
+            umbral = lambda: self.reconocedor.energy_threshold
+        if not self.activa:
+            raise OSError("La captura de audio no está activa")
+
+        spb = self.segundos_bloque
+        bloques_pausa = int(math.ceil(self.reconocedor.pause_threshold / spb))
+        bloques_frase = int(math.ceil(self.reconocedor.phrase_threshold / spb))
+        bloques_cola = int(math.ceil(self.reconocedor.non_speaking_duration / spb))
+        bytes_pre_roll = int(pre_roll * self.frecuencia) * self.ancho_muestra
+
+        cursor = self.posicion_inicial() if desde is None else desde
+        # El timeout es de reloj: repasar audio pendiente (rápido) no lo consume
+        limite = time.monotonic() + timeout if timeout else None
+
+        while True:
+            # Fase 1: esperar a que la energía supere el umbral
+            while True:
+                if limite and time.monotonic() > limite:
+                    # El silencio ya revisado no se vuelve a leer en la próxima escucha
+                    self.ultima_posicion = max(self.ultima_posicion, cursor)
+                    raise sr.WaitTimeoutError("Tiempo de espera agotado esperando una frase")
+                cursor, bloque = self._siguiente_bloque(cursor, spb * 4)
+                if bloque is None:
+                    if not self.activa:
+                        raise OSError("La captura de audio se detuvo")
+                    continue
+                if audioop.rms(bloque, self.ancho_muestra) > umbral():
+                    break
+                cursor += self.bytes_bloque
+
+            if al_inicio:
+                al_inicio()
+            inicio = max(cursor - bytes_pre_roll, self.buffer.mas_antiguo)
+            cursor += self.bytes_bloque
+
+            # Fase 2: grabar hasta detectar una pausa o superar el límite
+            bloques_voz = 1
+            bloques_silencio = 0
+            duracion = spb
+            cortada = bool(al_bloque and al_bloque(self.buffer.leer(inicio, cursor)))
+            while not cortada:
+                cursor, bloque = self._siguiente_bloque(cursor, spb * 4)
+                if bloque is None:
+                    if not self.activa:
+                        raise OSError("La captura de audio se detuvo")
+                    continue
+                cursor += self.bytes_bloque
+                duracion += spb
+                if audioop.rms(bloque, self.ancho_muestra) > umbral():
+                    bloques_voz += 1
+                    bloques_silencio = 0
+                else:
+                    bloques_silencio += 1
+                if bloques_silencio > bloques_pausa:
+                    break
+                if phrase_time_limit and duracion > phrase_time_limit:
+                    break
+                if al_bloque and al_bloque(bloque):
+                    cortada = True
+
+            # Ruido corto: descartar y seguir esperando
+            if cortada or bloques_voz >= bloques_frase:
+                break
+            if al_bloque:
+                al_bloque(None)
+
+        fin = cursor - max(0, bloques_silencio - bloques_cola) * self.bytes_bloque
+        self.ultima_posicion = cursor
+        datos = self.buffer.leer(inicio, fin)
+        return sr.AudioData(datos, self.frecuencia, self.ancho_muestra)
+
+
+class CapturaArchivo(CapturaContinua):
+    """Sustituto del micrófono que reproduce audio ya grabado en el buffer
+
+    Cada reproducir() encola unos datos PCM (mismo formato que la captura) y
+    la siguiente escucha empieza exactamente donde comienzan. Con
+    velocidad=1.0 se alimenta al ritmo real; con 0, tan rápido como se pueda.
+    """
+
+    def __init__(self, reconocedor, velocidad=0.0, **kwargs):
+        super().__init__(reconocedor, **kwargs)
+        self.velocidad = velocidad
+        self._cola = []
+        self._hay_datos = threading.Condition()
+        self._inicios = []  # Posición del buffer donde empieza cada audio encolado
+        self._fin_encolado = 0
+
+    def iniciar(self, timeout=5):
+        with self._lock:
+            if self.activa:
+                return
+            self.activa = True
+            self._hilo = threading.Thread(target=self._bucle_captura, daemon=True)
+            self._hilo.start()
+
+    def detener(self):
+        self.activa = False
+        with self._hay_datos:
+            self._hay_datos.notify_all()
+        if self._hilo:
+            self._hilo.join(timeout=1)
+
+    def reproducir(self, datos):
+        """Encola audio PCM; la próxima frase se busca desde su inicio"""
+        # Completar el último bloque para que las posiciones queden alineadas
+        datos = bytes(datos) + b"\0" * (-len(datos) % self.bytes_bloque)
+        with self._hay_datos:
+            inicio = max(self._fin_encolado, self.buffer.total)
+            self._inicios.append(inicio)
+            self._fin_encolado = inicio + len(datos)
+            self._cola.append(datos)
+            self._hay_datos.notify()
+
+    def escuchar_frase(self, *args, desde=None, **kwargs):
+        if desde is None and self._inicios:
+            desde = self._inicios.pop(0)
+        return super().escuchar_frase(*args, desde=desde, **kwargs)
+
+    def _bucle_captura(self):
+        while self.activa:
+            with self._hay_datos:
+                self._hay_datos.wait_for(lambda: self._cola or not self.activa)
+                if not self.activa:
+                    break
+                datos = self._cola.pop(0)
+            for i in range(0, len(datos), self.bytes_bloque):
+                self._agregar_bloque(datos[i:i + self.bytes_bloque])
+                if self.velocidad:
+                    time.sleep(self.segundos_bloque / self.velocidad)
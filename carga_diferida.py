@@ -0,0 +1,85 @@
+import importlib
+import threading
+import time
+from contextlib import contextmanager
+
+# --- CARGA DIFERIDA DE MÓDULOS ---
+TIEMPOS_IMPORTACION = {}  # módulo -> (milisegundos, hilo que lo importó)
+_DIFERIDOS = []
+
+
+@contextmanager
+def medir_importacion(nombre):
+    """Registra cuánto tarda un bloque de imports hechos al arrancar"""
+    inicio = time.perf_counter()
+    yield
+    TIEMPOS_IMPORTACION[nombre] = ((time.perf_counter() - inicio) * 1000,
+                                   threading.current_thread().name)
+
+
+class ModuloDiferido:
+    """Sustituto de un módulo que lo importa la primera vez que se usa
+
+    Se declara igual que un import normal (pywhatkit = importar_diferido("pywhatkit"))
+    y el costo de importarlo se paga en la primera llamada, no al arrancar.
+    """
+
+    def __init__(self, nombre, precargar=False):
+        self._nombre = nombre
+        self._modulo = None
+        self._lock = threading.Lock()
+        self.precargar = precargar  # Se importa en el hilo de precarga tras mostrar la ventana
+
+    @property
+    def cargado(self):
+        return self._modulo is not None
+
+    def cargar(self):
+        """Importa el módulo real (una sola vez aunque lo pidan varios hilos)"""
+        if self._modulo is None:
+            with self._lock:
+                if self._modulo is None:
+                    with medir_importacion(self._nombre):
+                        self._modulo = importlib.import_module(self._nombre)
+        return self._modulo
+
+    def __getattr__(self, atributo):
+        return getattr(self.cargar(), atributo)
+
+    def __repr__(self):
+        estado = "cargado" if self.cargado else "sin cargar"
+        return f"<módulo diferido {self._nombre!r} ({estado})>"
+
+
+def importar_diferido(nombre, precargar=False):
+    """Devuelve un ModuloDiferido para el módulo indicado"""
+    modulo = ModuloDiferido(nombre, precargar)
+    _DIFERIDOS.append(modulo)
+    return modulo
+
+
+def precargar_en_segundo_plano():
+    """Importa en un hilo aparte los módulos diferidos marcados para precarga"""
+    def precargar():
+        for modulo in _DIFERIDOS:
+            if modulo.precargar and not modulo.cargado:
+                try:
+                    modulo.cargar()
+                except Exception:
+                    pass  # Si falla, el error aparecerá en el primer uso real
+
+    hilo = threading.Thread(target=precargar, name="precarga", daemon=True)
+    hilo.start()
+    return hilo
+
+
+def perfil_importaciones():
+    """Tabla legible de los tiempos de importación registrados"""
+    lineas = []
+    for nombre, (ms, hilo) in sorted(TIEMPOS_IMPORTACION.items(), key=lambda t: -t[1][0]):
+        origen = "" if hilo == "MainThread" else f" ({hilo})"
+        lineas.append(f"  {ms:8.1f} ms  {nombre}{origen}")
+    pendientes = [m._nombre for m in _DIFERIDOS if not m.cargado]
+    if pendientes:
+        lineas.append("  sin cargar: " + ", ".join(sorted(set(pendientes))))
+    return "\n".join(lineas)
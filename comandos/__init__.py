@@ -0,0 +1,63 @@
+import importlib
+
+from intenciones import INTENCIONES, Interprete
+
+# --- REGISTRO DE GRUPOS DE COMANDOS ---
+# Cada grupo es un módulo de este paquete con una lista INTENCIONES y una
+# función comando_<intención>(app, comando, **slots) por cada una. Los grupos
+# declaran sus dependencias pesadas con carga_diferida para no pagarlas al arrancar.
+GRUPOS = ["busquedas", "sistema", "archivos", "multimedia", "productividad"]
+
+
+def manejador_simulado(nombre):
+    """Manejador que solo describe la intención, sin abrir, cerrar ni borrar nada"""
+    def manejador(app, comando, **slots):
+        return f"[{nombre}] {slots.get('texto', '')}".strip()
+    return manejador
+
+
+class RegistroComandos:
+    """Reúne las intenciones de todos los grupos y resuelve su manejador"""
+
+    def __init__(self, intenciones_base=()):
+        self.intenciones = list(intenciones_base)
+        self.grupos = {}
+        self._manejadores = {}
+        self._interprete = None
+
+    def registrar(self, nombre, modulo):
+        """Agrega un grupo; cada intención debe tener su función comando_<nombre>"""
+        for intencion in modulo.INTENCIONES:
+            manejador = getattr(modulo, f"comando_{intencion.nombre}", None)
+            if manejador is None:
+                raise ValueError(f"El grupo '{nombre}' no define comando_{intencion.nombre}")
+            self.intenciones.append(intencion)
+            self._manejadores[intencion.nombre] = manejador
+        self.grupos[nombre] = modulo
+        self._interprete = None  # Se recompila con la próxima consulta
+
+    def cargar(self, grupos=GRUPOS):
+        for nombre in grupos:
+            self.registrar(nombre, importlib.import_module(f"{__name__}.{nombre}"))
+
+    def interpretar(self, texto):
+        if self._interprete is None:
+            self._interprete = Interprete(self.intenciones)
+        return self._interprete.interpretar(texto)
+
+    def reemplazar_manejador(self, nombre, funcion):
+        """Cambia el manejador de una intención (por ejemplo, para simular efectos en benchmarks)"""
+        self._manejadores[nombre] = funcion
+
+    def simular(self):
+        """Sustituye todos los manejadores (también los del asistente) por manejador_simulado"""
+        for intencion in self.intenciones:
+            self.reemplazar_manejador(intencion.nombre, manejador_simulado(intencion.nombre))
+
+    def manejador(self, nombre):
+        """Función del grupo que atiende la intención, o None si es propia del asistente"""
+        return self._manejadores.get(nombre)
+
+
+REGISTRO = RegistroComandos(INTENCIONES)
+REGISTRO.cargar()
@@ -0,0 +1,234 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from carga_diferida import importar_diferido
+from intenciones import Intencion
+
+Image = importar_diferido("PIL.Image")
+shutil = importar_diferido("shutil")
+zipfile = importar_diferido("zipfile")
+
+# --- ARCHIVOS ---
+# Todas escriben o mueven archivos: solo se ejecutan con su frase exacta, nunca por parecido
+INTENCIONES = [
+    Intencion("comprimir_imagenes", ["comprimir"], 58, requiere=["imágenes"], difusa=False),
+    Intencion("backup", ["haz backup", "crear respaldo", "haz un respaldo", "copia de seguridad"], 55,
+              difusa=False),
+    Intencion("organizar_descargas", ["organiza descargas", "ordena descargas", "organiza las descargas",
+                                      "ordena las descargas"], 55, difusa=False),
+]
+
+
+def comprimir_imagen_individual(carpeta_origen, archivo, carpeta_destino):
+    """Comprime una imagen individual"""
+    try:
+        ruta_completa = os.path.join(carpeta_origen, archivo)
+        with Image.open(ruta_completa) as img:
+            img.save(os.path.join(carpeta_destino, archivo),
+                    optimize=True, quality=85)
+        return True
+    except:
+        return False
+
+def comprimir_imagenes_carpeta(carpeta):
+    """Comprime en paralelo las imágenes de una carpeta y devuelve cuántas comprimió"""
+    ruta_salida = os.path.join(carpeta, "comprimidas")
+    if not os.path.exists(ruta_salida):
+        os.makedirs(ruta_salida)
+
+    count = 0
+    archivos = [f for f in os.listdir(carpeta)
+               if f.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp'))]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = []
+        for archivo in archivos:
+            future = executor.submit(comprimir_imagen_individual,
+                                   carpeta, archivo, ruta_salida)
+            futures.append(future)
+
+        for future in futures:
+            if future.result():
+                count += 1
+    return count
+
+def organizar_descargas_rapido():
+    """Organiza la carpeta de descargas por tipo de archivo"""
+    try:
+        home = os.path.expanduser('~')
+        possible_dirs = ["Downloads", "Descargas"]
+        downloads_path = None
+        for d in possible_dirs:
+            p = os.path.join(home, d)
+            if os.path.exists(p):
+                downloads_path = p
+                break
+        if not downloads_path:
+            return "No encontré la carpeta de descargas"
+
+        tipos_archivo = {
+            'Imágenes': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', '.ico'],
+            'Documentos': ['.pdf', '.doc', '.docx', '.txt', '.rtf', '.odt', '.xls', '.xlsx', '.csv'],
+            'Videos': ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv'],
+            'Audio': ['.mp3', '.wav', '.flac', '.aac', '.ogg'],
+            'Programas': ['.exe', '.msi', '.dmg', '.deb', '.rpm'],
+            'Comprimidos': ['.zip', '.rar', '.7z', '.tar', '.gz'],
+            'Carpetas': []  # mover subcarpetas
+        }
+
+        archivos_movidos = 0
+
+        # Listar todo el contenido (archivos y carpetas)
+        items = os.listdir(downloads_path)
+
+        for filename in items:
+            ruta_item = os.path.join(downloads_path, filename)
+            if os.path.isdir(ruta_item):
+                # mover carpetas enteras a "Carpetas"
+                carpeta_dest = os.path.join(downloads_path, 'Carpetas')
+                if not os.path.exists(carpeta_dest):
+                    os.makedirs(carpeta_dest)
+                destino = os.path.join(carpeta_dest, filename)
+                try:
+                    os.rename(ruta_item, destino)
+                    archivos_movidos += 1
+                except:
+                    pass
+                continue
+
+            carpeta_dest = os.path.join(downloads_path, 'Carpetas')
+            if not os.path.exists(carpeta_dest):
+                os.makedirs(carpeta_dest)
+            destino = os.path.join(carpeta_dest, filename)
+            try:
+                os.rename(ruta_item, destino)
+                archivos_movidos += 1
+            except:
+                pass
+            continue
+
+            extension = os.path.splitext(filename)[1].lower()
+
+            for tipo, extensiones in tipos_archivo.items():
+                if extension in extensiones:
+                    # Crear carpeta si no existe
+                    carpeta_tipo = os.path.join(downloads_path, tipo)
+                    if not os.path.exists(carpeta_tipo):
+                        os.makedirs(carpeta_tipo)
+
+                    # Mover archivo
+                    origen = os.path.join(downloads_path, filename)
+                    destino = os.path.join(carpeta_tipo, filename)
+
+                    # Si el archivo ya existe en destino, agregar número
+                    if os.path.exists(destino):
+                        base, ext = os.path.splitext(filename)
+                        i = 1
+                        while os.path.exists(destino):
+                            nuevo_nombre = f"{base}_{i}{ext}"
+                            destino = os.path.join(carpeta_tipo, nuevo_nombre)
+                            i += 1
+
+                    try:
+                        os.rename(origen, destino)
+                        archivos_movidos += 1
+                    except:
+                        continue
+                    break
+
+        return f"Organizadas las descargas. {archivos_movidos} archivos movidos"
+    except Exception as e:
+        return f"Error organizando descargas: {str(e)}"
+
+def backup_rapido():
+    """Crea un backup rápido de documentos importantes"""
+    try:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_folder = os.path.join(os.path.expanduser('~'), f"Backup_EVA_{timestamp}")
+
+        if not os.path.exists(backup_folder):
+            os.makedirs(backup_folder)
+
+        # Carpetas importantes para backup
+        carpetas_importantes = [
+            os.path.join(os.path.expanduser('~'), "Documents"),
+            os.path.join(os.path.expanduser('~'), "Desktop")
+        ]
+
+        archivos_copiados = 0
+
+        for carpeta in carpetas_importantes:
+            if os.path.exists(carpeta):
+                carpeta_nombre = os.path.basename(carpeta)
+                destino_carpeta = os.path.join(backup_folder, carpeta_nombre)
+
+                # Copiar recursivamente todo el contenido manteniendo la estructura
+                for root_dir, dirs, files in os.walk(carpeta):
+                    rel_path = os.path.relpath(root_dir, carpeta)
+                    destino_dir_actual = os.path.join(destino_carpeta, rel_path)
+                    if not os.path.exists(destino_dir_actual):
+                        os.makedirs(destino_dir_actual)
+
+                    for archivo in files:
+                        origen_archivo = os.path.join(root_dir, archivo)
+                        destino_archivo = os.path.join(destino_dir_actual, archivo)
+                        try:
+                            shutil.copy2(origen_archivo, destino_archivo)
+                            archivos_copiados += 1
+                        except:
+                            continue
+
+        # Crear ZIP del backup
+        zip_path = f"{backup_folder}.zip"
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            for root, dirs, files in os.walk(backup_folder):
+                for file in files:
+                    file_path = os.path.join(root, file)
+                    arcname = os.path.relpath(file_path, backup_folder)
+                    zipf.write(file_path, arcname)
+
+        return f"Backup creado en {backup_folder} y comprimido en {zip_path}. {archivos_copiados} archivos respaldados"
+    except Exception as e:
+        return f"Error creando backup: {str(e)}"
+
+
+def comando_comprimir_imagenes(app, comando):
+    def proceso_compresion():
+        respuesta = app.preguntar("¿En qué carpeta quieres comprimir? Escritorio, descargas o imágenes",
+                                  "¿En qué carpeta? (escritorio, descargas, imágenes)")
+        if not respuesta:
+            return
+
+        directorios = {
+            "escritorio": os.path.join(os.path.expanduser('~'), "Desktop"),
+            "descargas": os.path.join(os.path.expanduser('~'), "Downloads"),
+            "imágenes": os.path.join(os.path.expanduser('~'), "Pictures")
+        }
+
+        carpeta_elegida = None
+        for nombre, ruta in directorios.items():
+            if nombre in respuesta:
+                carpeta_elegida = ruta
+                break
+
+        if not carpeta_elegida:
+            app.avisar("No reconocí esa carpeta")
+            return
+
+        try:
+            count = comprimir_imagenes_carpeta(carpeta_elegida)
+            app.avisar(f"¡Listo! Comprimí {count} imágenes" if count > 0 else "No encontré imágenes para comprimir")
+        except Exception as e:
+            app.avisar(f"Error en compresión: {str(e)}", tipo="Sistema")
+
+    threading.Thread(target=proceso_compresion, daemon=True).start()
+
+def comando_organizar_descargas(app, comando):
+    return organizar_descargas_rapido()
+
+def comando_backup(app, comando):
+    app.avisar("Iniciando respaldo, te avisaré al terminar")
+    threading.Thread(target=lambda: app.avisar(backup_rapido()), daemon=True).start()
+    return "Backup en progreso"
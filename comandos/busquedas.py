@@ -0,0 +1,50 @@
+import threading
+import webbrowser
+
+from carga_diferida import importar_diferido
+from intenciones import Intencion
+
+pywhatkit = importar_diferido("pywhatkit", precargar=True)  # Al importarse consulta la red
+
+# --- BÚSQUEDAS ---
+INTENCIONES = [
+    Intencion("youtube", ["busca en youtube"], 70, con_texto=True),
+    Intencion("busca_google", ["busca"], 65, requiere=["google"], con_texto=True),
+    Intencion("busca", ["busca"], 60, con_texto=True),
+]
+
+
+def buscar_youtube_rapido(query):
+    """Búsqueda de YouTube optimizada"""
+    try:
+        # Usar threading para no bloquear
+        def abrir_youtube():
+            pywhatkit.playonyt(query)
+
+        thread = threading.Thread(target=abrir_youtube)
+        thread.daemon = True
+        thread.start()
+        return True
+    except:
+        return False
+
+def buscar_google_rapido(query):
+    """Búsqueda de Google ultra rápida"""
+    url = f"https://www.google.com/search?q={query.replace(' ', '+')}"
+    threading.Thread(target=lambda: webbrowser.open(url), daemon=True).start()
+
+
+def comando_youtube(app, comando, texto):
+    if not texto:
+        return "¿Qué quieres buscar en YouTube?"
+    buscar_youtube_rapido(texto)
+    return f"Buscando '{texto}' en YouTube"
+
+def comando_busca_google(app, comando, texto):
+    return comando_busca(app, comando, texto)
+
+def comando_busca(app, comando, texto):
+    if not texto:
+        return "¿Qué quieres buscar?"
+    buscar_google_rapido(texto)
+    return f"Buscando '{texto}' en Google"
@@ -0,0 +1,97 @@
+import glob
+import json
+import os
+import platform
+import subprocess
+import threading
+import webbrowser
+
+from intenciones import Intencion
+
+# --- MULTIMEDIA ---
+INTENCIONES = [
+    Intencion("musica_local", ["pon música", "reproduce música"], 55,
+              ejemplos=["pon mi música", "reproducir música"]),
+    Intencion("favoritos", ["reproduce", "pon"], 45, difusa=False),
+    Intencion("noticias", ["noticias"], 40, ejemplos=["dime las noticias", "qué hay de nuevo"]),
+]
+
+
+def cargar_favoritos():
+    try:
+        with open('favoritos.json', 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print("Creando archivo de favoritos...")
+        favoritos_default = {
+            "música relajante": "https://www.youtube.com/watch?v=jfKfPfyJRdk",
+            "noticias": "https://www.youtube.com/watch?v=live_news"
+        }
+        with open('favoritos.json', 'w', encoding='utf-8') as f:
+            json.dump(favoritos_default, f, indent=2, ensure_ascii=False)
+        return favoritos_default
+
+FAVORITOS = None  # Se leen en el primer uso
+
+
+def obtener_favoritos():
+    global FAVORITOS
+    if FAVORITOS is None:
+        FAVORITOS = cargar_favoritos()
+    return FAVORITOS
+
+
+def obtener_noticias_rapido():
+    """Obtiene noticias de forma rápida"""
+    try:
+        # Simulación de noticias - puedes integrar una API real
+        noticias = [
+            "Tecnología: Nuevos avances en IA",
+            "Ciencia: Descubrimiento espacial",
+            "Deportes: Resultados del día"
+        ]
+        return "Últimas noticias: " + ", ".join(noticias[:2])
+    except:
+        return "No pude obtener las noticias"
+
+def reproducir_musica_local():
+    """Reproduce música local"""
+    try:
+        # Buscar archivos de música en carpetas comunes
+        rutas_musica = [
+            os.path.join(os.path.expanduser('~'), "Music", "*.mp3"),
+            os.path.join(os.path.expanduser('~'), "Música", "*.mp3"),
+            os.path.join(os.path.expanduser('~'), "Downloads", "*.mp3")
+        ]
+
+        archivos_musica = []
+        for ruta in rutas_musica:
+            archivos_musica.extend(glob.glob(ruta))
+
+        if archivos_musica:
+            archivo_aleatorio = archivos_musica[0]  # Tomar el primero por simplicidad
+            if platform.system() == "Windows":
+                os.startfile(archivo_aleatorio)
+            elif platform.system() == "Darwin":
+                subprocess.call(["open", archivo_aleatorio])
+            else:
+                subprocess.call(["xdg-open", archivo_aleatorio])
+            return "Reproduciendo música local"
+        else:
+            return "No encontré archivos de música"
+    except:
+        return "Error reproduciendo música"
+
+
+def comando_favoritos(app, comando):
+    for nombre, url in obtener_favoritos().items():
+        if nombre.lower() in comando:
+            threading.Thread(target=webbrowser.open, args=(url,), daemon=True).start()
+            return f"Reproduciendo {nombre}"
+    return "No encontré ese favorito"
+
+def comando_musica_local(app, comando):
+    return reproducir_musica_local()
+
+def comando_noticias(app, comando):
+    return obtener_noticias_rapido()
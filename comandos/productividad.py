@@ -0,0 +1,107 @@
+import threading
+import time
+from datetime import datetime
+
+from carga_diferida import importar_diferido
+from intenciones import Intencion
+
+plyer = importar_diferido("plyer")
+
+# --- PRODUCTIVIDAD ---
+INTENCIONES = [
+    Intencion("nota", ["crea una nota", "anota"], 55, con_texto=True),
+    Intencion("traducir", ["traduce"], 55, con_texto=True),
+    Intencion("calcular", ["calcula", "cuánto es"], 55, con_texto=True),
+
+    Intencion("clima", ["clima", "tiempo"], 35, ejemplos=["cómo está el clima", "va a llover"]),
+    Intencion("recordatorio", ["recordar", "recordatorio"], 35, ejemplos=["recuérdame algo"]),
+    Intencion("hora", ["qué hora es", "hora"], 35, ejemplos=["qué horas son", "dime la hora"]),
+    Intencion("fecha", ["qué día es", "fecha"], 35, ejemplos=["qué fecha es hoy", "a cuántos estamos"]),
+]
+
+
+def obtener_clima_rapido():
+    """Obtiene el clima de forma rápida"""
+    try:
+        # API gratuita de OpenWeatherMap (necesitas registrarte)
+        # Por simplicidad, retornamos un mensaje genérico
+        return "El clima está agradable hoy"
+    except:
+        return "No pude obtener el clima"
+
+def crear_recordatorio(mensaje, minutos):
+    """Crea recordatorios rápidos"""
+    def mostrar_recordatorio():
+        time.sleep(minutos * 60)
+        plyer.notification.notify(
+            title="Recordatorio EVA",
+            message=mensaje,
+            timeout=10
+        )
+
+    threading.Thread(target=mostrar_recordatorio, daemon=True).start()
+    return f"Recordatorio creado para {minutos} minutos"
+
+def traducir_texto_rapido(texto, idioma_destino="en"):
+    """Traducción rápida básica"""
+    traducciones_basicas = {
+        "hola": {"en": "hello", "fr": "bonjour"},
+        "gracias": {"en": "thank you", "fr": "merci"},
+        "adiós": {"en": "goodbye", "fr": "au revoir"}
+    }
+
+    texto_lower = texto.lower()
+    if texto_lower in traducciones_basicas:
+        return traducciones_basicas[texto_lower].get(idioma_destino, texto)
+    return f"Traducción de '{texto}' no disponible"
+
+def calcular_rapido(expresion):
+    """Calculadora rápida para operaciones básicas"""
+    try:
+        # Limpieza básica de seguridad y normalización de operadores
+        expresion = expresion.replace('entre', '/').replace('dividido', '/')
+        expresion_limpia = ''.join(c for c in expresion if c in '0123456789+-*/()., ')
+        resultado = eval(expresion_limpia)
+        return f"El resultado es {resultado}"
+    except:
+        return "No pude realizar el cálculo"
+
+def crear_nota_rapida(contenido):
+    """Crea una nota rápida"""
+    try:
+        if not contenido:
+            return "¿Qué quieres que anote?"
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"nota_eva_{timestamp}.txt"
+
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(f"Nota creada por EVA - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write("="*50 + "\n\n")
+            f.write(contenido)
+
+        return f"Nota guardada como {filename}"
+    except:
+        return "Error creando la nota"
+
+
+def comando_nota(app, comando, texto):
+    return crear_nota_rapida(texto) if texto else "¿Qué quieres anotar?"
+
+def comando_traducir(app, comando, texto):
+    return traducir_texto_rapido(texto) if texto else "¿Qué quieres que traduzca?"
+
+def comando_calcular(app, comando, texto):
+    return calcular_rapido(texto) if texto else "¿Qué quieres que calcule?"
+
+def comando_clima(app, comando):
+    return obtener_clima_rapido()
+
+def comando_recordatorio(app, comando):
+    return "Los recordatorios están en desarrollo"
+
+def comando_hora(app, comando):
+    return f"Son las {datetime.now().strftime('%H:%M')}"
+
+def comando_fecha(app, comando):
+    return f"Hoy es {datetime.now().strftime('%d de %B de %Y')}"
@@ -0,0 +1,231 @@
+import os
+import platform
+import re
+import subprocess
+import threading
+
+import psutil
+
+from aplicaciones import APLICACIONES
+from intenciones import Intencion, buscar_nombres, normalizar_nombre
+from monitor_sistema import MONITOR
+
+# --- SISTEMA Y APLICACIONES ---
+INTENCIONES = [
+    Intencion("confirmar_apagado", ["confirmar apagado"], 85, difusa=False),
+    Intencion("apagar", ["apagar"], 80, requiere=["equipo"], difusa=False),
+
+    # Volumen
+    Intencion("subir_volumen", ["subir volumen", "aumentar volumen", "sube volumen", "sube el volumen"], 50,
+              ejemplos=["súbele al volumen", "más volumen", "volumen más alto"]),
+    Intencion("bajar_volumen", ["bajar volumen", "disminuir volumen", "baja volumen", "baja el volumen"], 50,
+              ejemplos=["bájale al volumen", "menos volumen", "volumen más bajo"]),
+    Intencion("silenciar", ["silenciar"], 50, ejemplos=["silencia", "silencio", "quita el sonido"]),
+
+    # Aplicaciones
+    Intencion("calculadora", ["calculadora"], 40, ejemplos=["abre la calculadora", "calculador"]),
+    Intencion("notepad", ["notepad", "bloc de notas"], 40, ejemplos=["abre el bloc de notas", "block de notas"]),
+    Intencion("explorador", ["explorador", "archivos"], 40, ejemplos=["abre el explorador de archivos"]),
+    Intencion("administrador", ["administrador", "tareas"], 40, ejemplos=["administrador de tareas"]),
+
+    Intencion("cerrar", ["cierra", "cerrar", "cierre"], 75, con_texto=True),
+    # Por debajo de las aplicaciones con intención propia ("abre la calculadora")
+    Intencion("abrir", ["abre", "abrir", "ejecuta", "lanza"], 38, con_texto=True),
+    Intencion("procesos", ["consumiendo", "consume", "procesos"], 36,
+              ejemplos=["qué está consumiendo", "qué programa usa más memoria", "qué gasta la cpu"]),
+    Intencion("sistema", ["sistema", "información"], 35, ejemplos=["estado del sistema", "cómo está el equipo"]),
+]
+
+
+# Atajos con nombre en español para las aplicaciones del sistema
+APPS_BASICAS = {
+    "Windows": {
+        "calculadora": "calc.exe",
+        "notepad": "notepad.exe",
+        "explorador": "explorer.exe",
+        "administrador": "taskmgr.exe",
+        "paint": "mspaint.exe"
+    },
+    "Darwin": {
+        "calculadora": "open -a Calculator",
+        "notas": "open -a TextEdit",
+        "finder": "open -a Finder",
+        "monitor": "open -a 'Activity Monitor'"
+    },
+    "Linux": {
+        "calculadora": "gnome-calculator",
+        "editor": "gedit",
+        "archivos": "nautilus",
+        "monitor": "gnome-system-monitor"
+    }
+}.get(platform.system(), {})
+ARTICULO = re.compile(r"^(el|la|los|las|al|a) ")
+OPCIONES_CERRAR = 4  # Programas que se nombran al preguntar cuál cerrar
+
+
+def obtener_info_sistema():
+    """Información del sistema según la última muestra del monitor (no bloquea)"""
+    try:
+        muestra = MONITOR.ultima()
+        return f"CPU al {muestra['cpu']:.1f}%, RAM al {muestra['ram']:.1f}%, disco al {muestra['disco']:.1f}%"
+    except:
+        return "No pude obtener la información del sistema"
+
+def describir_procesos(cantidad=3, por="cpu"):
+    """Frase con los procesos que más CPU o memoria consumen"""
+    procesos = MONITOR.procesos.top(cantidad, por)
+    if not procesos:
+        return "No pude leer los procesos"
+    if por == "cpu":
+        return "Más CPU: " + ", ".join(f"{p['nombre']} {p['cpu']:.0f}%" for p in procesos)
+    return "Más memoria: " + ", ".join(f"{p['nombre']} {p['memoria_mb']:.0f} MB" for p in procesos)
+
+def cerrar_procesos(procesos, espera=3):
+    """Pide a los procesos que terminen y fuerza a los que no lo hacen; devuelve cuántos cerró"""
+    for proceso in procesos:
+        try:
+            proceso.terminate()
+        except psutil.NoSuchProcess:
+            pass
+    _, vivos = psutil.wait_procs(procesos, timeout=espera)
+    for proceso in vivos:
+        try:
+            proceso.kill()
+        except psutil.NoSuchProcess:
+            pass
+    return len(procesos) - len(psutil.wait_procs(vivos, timeout=1)[1])
+
+def abrir_app_rapido(app_name):
+    """Abre una aplicación por su nombre y devuelve el de la que abrió (o None)
+
+    Primero los atajos de APPS_BASICAS; después, el índice de aplicaciones
+    instaladas, que se consulta en memoria sin recorrer el disco.
+    """
+    cmd = APPS_BASICAS.get(app_name)
+    if cmd:
+        # Usar Popen para no bloquear
+        subprocess.Popen(cmd, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return app_name
+    encontradas = APLICACIONES.buscar(app_name)
+    if encontradas:
+        APLICACIONES.abrir(encontradas[0])
+        return encontradas[0]["nombre"]
+    return None
+
+def controlar_volumen(accion):
+    """Control de volumen rápido"""
+    sistema = platform.system()
+    if sistema == "Windows":
+        if accion == "subir":
+            os.system("nircmd changesysvolume 5000")
+        elif accion == "bajar":
+            os.system("nircmd changesysvolume -5000")
+        elif accion == "silenciar":
+            os.system("nircmd mutesysvolume 1")
+
+
+def comando_sistema(app, comando):
+    return obtener_info_sistema()
+
+def comando_abrir(app, comando, texto=""):
+    nombre = ARTICULO.sub("", texto)
+    if not nombre:
+        return "¿Qué aplicación quieres que abra?"
+    abierta = abrir_app_rapido(nombre)
+    return f"Abriendo {abierta}" if abierta else f"No encontré la aplicación {nombre}"
+
+def enumerar(nombres):
+    """Hasta OPCIONES_CERRAR nombres separados por comas y cuántos más hay"""
+    nombres = list(nombres)
+    texto = ", ".join(nombres[:OPCIONES_CERRAR])
+    if len(nombres) > OPCIONES_CERRAR:
+        texto += f" y {len(nombres) - OPCIONES_CERRAR} más"
+    return texto
+
+def comando_cerrar(app, comando, texto=""):
+    nombre = ARTICULO.sub("", texto)
+    if not nombre:
+        return "¿Qué programa quieres que cierre?"
+    if not MONITOR.procesos.actualizado:
+        return "Todavía estoy leyendo los procesos, inténtalo en un momento"
+    encontrados, exacto = MONITOR.procesos.buscar(nombre)
+    if not encontrados:
+        return f"No encontré ningún programa abierto llamado {nombre}"
+
+    def cerrar(elegidos):
+        procesos = [p for nombre_proceso in elegidos for p in encontrados[nombre_proceso]]
+        nombres = enumerar(elegidos)
+        try:
+            cerrados = cerrar_procesos(procesos)
+        except psutil.AccessDenied:
+            return f"No tengo permiso para cerrar {nombres}"
+        return f"Cerré {nombres}" if cerrados else f"No pude cerrar {nombres}"
+
+    if len(encontrados) == 1 and exacto:
+        return cerrar(list(encontrados))
+
+    def confirmar_uno():
+        # Un nombre parecido puede ser otro programa ("sesión" -> gnome-session): se pregunta antes
+        elegido = next(iter(encontrados))
+        respuesta = app.preguntar(f"¿Cierro {elegido}?", f"¿Cierro {elegido}? (sí o no)")
+        if respuesta and re.search(r"\b(s[ií]|claro|dale|ciérralo|confirmo)\b", respuesta):
+            app.avisar(cerrar([elegido]))
+        else:
+            app.avisar("De acuerdo, no cierro nada")
+
+    def confirmar():
+        opciones = list(encontrados)[:OPCIONES_CERRAR]
+        respuesta = app.preguntar(f"Hay varios programas abiertos: {enumerar(encontrados)}. ¿Cuál cierro? Puedes decir todos",
+                                  f"¿Cuál cierro? ({enumerar(encontrados)} o todos)")
+        if not respuesta:
+            return
+        if "todos" in respuesta:
+            app.avisar(cerrar(list(encontrados)))  # Todos los encontrados, no solo los nombrados
+            return
+        normalizados = {normalizar_nombre(n): n for n in opciones}
+        elegidos = [normalizados[n] for n in buscar_nombres(respuesta, normalizados)]
+        app.avisar(cerrar(elegidos[:1]) if elegidos else "No cerré nada")
+
+    threading.Thread(target=confirmar_uno if len(encontrados) == 1 else confirmar, daemon=True).start()
+
+def comando_procesos(app, comando):
+    if not MONITOR.procesos.actualizado:
+        return "Todavía estoy leyendo los procesos, pregúntame en un momento"
+    if any(palabra in comando for palabra in ("memoria", "ram")):
+        return describir_procesos(por="memoria")
+    if "cpu" in comando or "procesador" in comando:
+        return describir_procesos(por="cpu")
+    # Sin procesos legibles ambas frases son el mismo aviso: se dice una vez
+    return ". ".join(dict.fromkeys([describir_procesos(por="cpu"), describir_procesos(por="memoria")]))
+
+def comando_calculadora(app, comando):
+    return "Calculadora abierta" if abrir_app_rapido("calculadora") else "No pude abrir la calculadora"
+
+def comando_notepad(app, comando):
+    return "Bloc de notas abierto" if abrir_app_rapido("notepad") else "No pude abrir el bloc de notas"
+
+def comando_explorador(app, comando):
+    return "Explorador de archivos abierto" if abrir_app_rapido("explorador") else "No pude abrir el explorador"
+
+def comando_administrador(app, comando):
+    return "Administrador de tareas abierto" if abrir_app_rapido("administrador") else "No pude abrir el administrador de tareas"
+
+def comando_subir_volumen(app, comando):
+    controlar_volumen("subir")
+    return "Volumen aumentado"
+
+def comando_bajar_volumen(app, comando):
+    controlar_volumen("bajar")
+    return "Volumen disminuido"
+
+def comando_silenciar(app, comando):
+    controlar_volumen("silenciar")
+    return "Audio silenciado"
+
+def comando_apagar(app, comando):
+    return "¿Estás seguro? Di 'confirmar apagado' para continuar"
+
+def comando_confirmar_apagado(app, comando):
+    if platform.system() == "Windows":
+        os.system("shutdown /s /t 10")
+    return "Apagando equipo en 10 segundos..."
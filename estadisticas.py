@@ -0,0 +1,37 @@
+import threading
+
+# --- ESTADÍSTICAS DE RENDIMIENTO ---
+
+
+class Estadisticas:
+    """Acumuladores de métricas por nombre (conteo, suma y último valor)"""
+
+    def __init__(self):
+        self._valores = {}
+        self._lock = threading.Lock()
+
+    def registrar(self, nombre, valor):
+        """Suma un valor a la métrica indicada"""
+        with self._lock:
+            conteo, suma, _ = self._valores.get(nombre, (0, 0.0, 0.0))
+            self._valores[nombre] = (conteo + 1, suma + valor, valor)
+
+    def resumen(self):
+        """Diccionario {métrica: {conteo, total, promedio, ultimo}}"""
+        with self._lock:
+            return {
+                nombre: {"conteo": conteo, "total": suma,
+                         "promedio": suma / conteo if conteo else 0.0, "ultimo": ultimo}
+                for nombre, (conteo, suma, ultimo) in self._valores.items()
+            }
+
+    def texto(self):
+        """Resumen legible para el log de conversación"""
+        lineas = []
+        for nombre, datos in sorted(self.resumen().items()):
+            lineas.append(f"- {nombre}: promedio {datos['promedio']:.1f}, "
+                          f"total {datos['total']:.0f} ({datos['conteo']} muestras)")
+        return "\n".join(lineas) if lineas else "Sin datos todavía"
+
+
+ESTADISTICAS = Estadisticas()
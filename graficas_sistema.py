@@ -0,0 +1,79 @@
+import numpy as np
+
+from monitor_sistema import MONITOR
+
+# --- GRÁFICAS DE RECURSOS (SPARKLINES) ---
+CUADROS_POR_SEGUNDO = 4  # Frecuencia máxima de redibujo; las muestras intermedias se agrupan
+SEGUNDOS_GRAFICAS = 120  # Historia visible
+# (nombre, etiqueta, color, escala fija o None para ajustar al máximo visible)
+GRAFICAS = [
+    ("cpu", "CPU", "#4CAF50", 100.0),
+    ("ram", "RAM", "#2196F3", 100.0),
+    ("disco", "Disco", "#FF9800", 100.0),
+    ("red", "Red", "#E91E63", None),
+]
+MARGEN = 6
+
+
+class GraficasSistema:
+    """Sparklines de CPU, RAM, disco y red dibujadas en un tk.Canvas
+
+    Cada gráfica es una línea y un texto que se crean una sola vez; al
+    redibujar solo se cambian sus coordenadas y su texto. El redibujo se
+    revisa a CUADROS_POR_SEGUNDO y se omite si no hay muestras nuevas ni
+    cambió el tamaño del canvas.
+    """
+
+    def __init__(self, canvas, monitor=MONITOR, segundos=SEGUNDOS_GRAFICAS):
+        self.canvas = canvas
+        self.monitor = monitor
+        self.segundos = segundos
+        self._lineas = {}
+        self._textos = {}
+        self._dibujado = None  # (muestras, ancho, alto) del último cuadro
+        for nombre, etiqueta, color, _ in GRAFICAS:
+            self._lineas[nombre] = canvas.create_line(0, 0, 0, 0, fill=color, width=2)
+            self._textos[nombre] = canvas.create_text(0, 0, anchor="nw", fill=color,
+                                                      font=("TkDefaultFont", 9), text=etiqueta)
+        self._programar()
+
+    def _programar(self):
+        self.canvas.after(int(1000 / CUADROS_POR_SEGUNDO), self._cuadro)
+
+    def _cuadro(self):
+        if not self.canvas.winfo_exists():
+            return
+        try:
+            ancho, alto = self.canvas.winfo_width(), self.canvas.winfo_height()
+            estado = (self.monitor.total, ancho, alto)
+            if ancho > 1 and estado != self._dibujado:
+                self.redibujar(ancho, alto)
+                self._dibujado = estado  # Si falla, se reintenta en el próximo cuadro
+        except Exception as e:
+            print(f"Error dibujando gráficas: {e}")
+        finally:
+            self._programar()  # Un cuadro fallido no detiene las gráficas
+
+    def serie(self, nombre):
+        cantidad = max(2, int(self.segundos / self.monitor.intervalo))
+        if nombre == "red":
+            # Una sola lectura: entre dos llamadas podría llegar una muestra y cambiar el largo
+            enviado, recibido = self.monitor.series("red_enviado_kbps", "red_recibido_kbps", cantidad=cantidad)
+            return enviado + recibido
+        return self.monitor.serie(nombre, cantidad)
+
+    def redibujar(self, ancho, alto):
+        ancho_celda = ancho / len(GRAFICAS)
+        for i, (nombre, etiqueta, _, escala) in enumerate(GRAFICAS):
+            valores = np.nan_to_num(self.serie(nombre))
+            izquierda = i * ancho_celda + MARGEN
+            self.canvas.coords(self._textos[nombre], izquierda, 2)
+            if len(valores) < 2:
+                continue
+            ultimo = f"{valores[-1]:.0f} KB/s" if escala is None else f"{valores[-1]:.0f}%"
+            self.canvas.itemconfigure(self._textos[nombre], text=f"{etiqueta} {ultimo}")
+
+            tope = escala or max(float(valores.max()), 1.0)
+            x = np.linspace(izquierda, izquierda + ancho_celda - 2 * MARGEN, len(valores))
+            y = alto - MARGEN - np.clip(valores / tope, 0, 1) * (alto - 2 * MARGEN - 14)
+            self.canvas.coords(self._lineas[nombre], *np.column_stack((x, y)).ravel().tolist())
@@ -0,0 +1,237 @@
+import re
+import unicodedata
+from difflib import SequenceMatcher
+
+import numpy as np
+
+UMBRAL_DIFUSO = 0.6  # Similitud coseno mínima para aceptar una intención aproximada
+UMBRAL_DIFUSO_PALABRA = 0.8  # Una sola palabra ("más", "descargas") comparte n-gramas con casi todo
+LONGITUD_MINIMA_DIFUSA = 4  # Palabras sueltas más cortas no se clasifican
+TAMANO_NGRAMA = 3
+UMBRAL_NOMBRES = 0.75  # Parecido mínimo entre un nombre dicho y el de un programa
+
+# --- TABLA DE INTENCIONES ---
+
+
+class Intencion:
+    """Entrada declarativa: frases que la activan y cómo extraer sus parámetros"""
+
+    def __init__(self, nombre, frases, prioridad=0, requiere=(), con_texto=False,
+                 ejemplos=(), difusa=True):
+        self.nombre = nombre
+        self.frases = list(frases)
+        self.prioridad = prioridad  # Gana la intención de mayor prioridad presente
+        self.requiere = list(requiere)  # Palabras que además deben aparecer
+        self.con_texto = con_texto  # El resto de la frase se entrega como parámetro "texto"
+        self.ejemplos = list(ejemplos)  # Frases de ejemplo extra para la clasificación aproximada
+        # Sin texto libre, el parámetro no se puede extraer. Las intenciones que
+        # modifican archivos o el equipo se declaran difusa=False: solo con su frase exacta
+        self.difusa = difusa and not con_texto
+
+
+class Coincidencia:
+    def __init__(self, nombre, slots, posicion, confianza=1.0, aproximada=False):
+        self.nombre = nombre
+        self.slots = slots
+        self.posicion = posicion
+        self.confianza = confianza
+        self.aproximada = aproximada  # Viene del clasificador difuso, no de una frase exacta
+
+    def __repr__(self):
+        return f"Coincidencia({self.nombre!r}, {self.slots!r})"
+
+
+# Intenciones propias del asistente; los grupos de comandos agregan las suyas
+INTENCIONES = [
+    Intencion("entrenar_activacion", ["entrena"], 90, requiere=["activación"]),
+    Intencion("estadisticas", ["estadísticas", "rendimiento", "latencia"], 30,
+              ejemplos=["dime las estadísticas", "qué tan rápido respondes"]),
+
+    # Cortesía
+    Intencion("saludo", ["hola", "buenos días", "buenas tardes", "buenas noches"], 20),
+    Intencion("gracias", ["gracias"], 20, ejemplos=["muchas gracias", "te lo agradezco"]),
+    Intencion("como_estas", ["cómo estás"], 20, ejemplos=["qué tal estás", "cómo te va"]),
+
+    # Salida: "para" es muy común dentro de otras órdenes, por eso va al final
+    Intencion("salir", ["detente", "para", "adiós", "terminar"], 10, difusa=False),
+]
+
+
+class MatcherIntenciones:
+    """Compila la tabla en una sola expresión regular que se recorre una vez por comando"""
+
+    def __init__(self, intenciones):
+        self.intenciones = list(intenciones)
+        self._por_frase = {}
+        for intencion in self.intenciones:
+            for frase in intencion.requiere:
+                self._por_frase.setdefault(frase, [])
+            for frase in intencion.frases:
+                self._por_frase.setdefault(frase, []).append(intencion)
+
+        # Las frases largas van primero para que "busca en youtube" gane a "busca"
+        alternativas = sorted(self._por_frase, key=len, reverse=True)
+        self._patron = re.compile(r"\b(?:" + "|".join(map(re.escape, alternativas)) + r")\b")
+        self._patrones_resto = {
+            intencion.nombre: re.compile(r"\b(?:" + "|".join(
+                map(re.escape, sorted(intencion.frases + intencion.requiere, key=len, reverse=True))) + r")\b")
+            for intencion in self.intenciones if intencion.con_texto
+        }
+
+    def buscar(self, texto):
+        """Devuelve la Coincidencia de mayor prioridad o None"""
+        encontradas = {}  # frase -> primera posición
+        for m in self._patron.finditer(texto):
+            encontradas.setdefault(m.group(0), m.start())
+
+        mejor = None
+        for frase, posicion in encontradas.items():
+            for intencion in self._por_frase[frase]:
+                if any(r not in encontradas for r in intencion.requiere):
+                    continue
+                clave = (-intencion.prioridad, posicion)
+                if mejor is None or clave < mejor[0]:
+                    mejor = (clave, intencion)
+        if mejor is None:
+            return None
+
+        (_, posicion), intencion = mejor
+        slots = {}
+        if intencion.con_texto:
+            resto = self._patrones_resto[intencion.nombre].sub("", texto)
+            slots["texto"] = " ".join(resto.split())
+        return Coincidencia(intencion.nombre, slots, posicion)
+
+
+def ngramas(texto, n=TAMANO_NGRAMA):
+    """N-gramas de caracteres de cada palabra, con bordes marcados"""
+    resultado = []
+    for palabra in texto.lower().split():
+        palabra = f" {palabra} "
+        resultado.extend(palabra[i:i + n] for i in range(len(palabra) - n + 1))
+    return resultado
+
+
+def normalizar_nombre(texto):
+    """Nombre de programa comparable: minúsculas, sin acentos ni extensión, solo letras y números"""
+    texto = unicodedata.normalize("NFKD", texto.lower())
+    texto = "".join(c for c in texto if not unicodedata.combining(c))
+    texto = re.sub(r"\.(exe|app|desktop|lnk)$", "", texto.strip())
+    return " ".join(re.findall(r"[a-z0-9]+", texto))
+
+
+def es_nombre_exacto(consulta, nombre):
+    """El nombre dicho es el del programa, salvo espacios ("fire fox" -> "firefox")"""
+    return normalizar_nombre(consulta).replace(" ", "") == normalizar_nombre(nombre).replace(" ", "")
+
+
+def buscar_nombres(consulta, nombres, umbral=UMBRAL_NOMBRES):
+    """Nombres normalizados que corresponden a lo dicho, del mejor al peor
+
+    Primero el nombre exacto; si no, los que contienen la consulta (o están
+    contenidos en ella) como palabras completas; si tampoco, los parecidos
+    al nombre completo o a alguna de sus palabras ("calculadora" ~ "calculator").
+    """
+    consulta = normalizar_nombre(consulta)
+    if not consulta:
+        return []
+    if consulta in nombres:
+        return [consulta]
+    compacta = consulta.replace(" ", "")  # "fire fox" -> "firefox"
+    exactos = [n for n in nombres if n.replace(" ", "") == compacta]
+    if exactos:
+        return exactos
+    rodeada = f" {consulta} "
+    parciales = [n for n in nombres if rodeada in f" {n} " or f" {n} " in rodeada]
+    if parciales:
+        return sorted(parciales, key=lambda n: abs(len(n) - len(consulta)))
+
+    comparador = SequenceMatcher()
+    comparador.set_seq2(consulta)
+    puntajes = []
+    for nombre in nombres:
+        mejor = 0.0
+        for candidato in {nombre, *nombre.split()}:
+            comparador.set_seq1(candidato)
+            # Las cotas rápidas descartan casi todos los nombres sin calcular ratio()
+            if comparador.real_quick_ratio() >= umbral and comparador.quick_ratio() >= umbral:
+                mejor = max(mejor, comparador.ratio())
+        if mejor >= umbral:
+            puntajes.append((mejor, nombre))
+    return [nombre for _, nombre in sorted(puntajes, reverse=True)]
+
+
+class ClasificadorDifuso:
+    """TF-IDF de n-gramas de caracteres con similitud coseno sobre frases de ejemplo
+
+    Tolera errores del reconocedor ("calculador", "súbele al volumen"). Solo
+    considera intenciones sin texto libre y marcadas como difusas.
+    """
+
+    def __init__(self, intenciones, umbral=UMBRAL_DIFUSO):
+        self.umbral = umbral
+        ejemplos, etiquetas = [], []
+        for intencion in intenciones:
+            if not intencion.difusa:
+                continue
+            for ejemplo in intencion.frases + intencion.ejemplos:
+                ejemplos.append(ngramas(ejemplo))
+                etiquetas.append(intencion.nombre)
+
+        self._vocabulario = {}
+        for grams in ejemplos:
+            for g in grams:
+                self._vocabulario.setdefault(g, len(self._vocabulario))
+        conteos = np.zeros((len(ejemplos), len(self._vocabulario)), dtype=np.float32)
+        for fila, grams in enumerate(ejemplos):
+            np.add.at(conteos[fila], [self._vocabulario[g] for g in grams], 1.0)
+
+        # IDF suavizado y matriz de ejemplos normalizada, calculados una sola vez
+        documentos = (conteos > 0).sum(axis=0)
+        self._idf = (np.log((1 + len(ejemplos)) / (1 + documentos)) + 1).astype(np.float32)
+        matriz = conteos * self._idf
+        self._matriz = matriz / (np.linalg.norm(matriz, axis=1, keepdims=True) + 1e-9)
+
+        # Ejemplos ordenados por intención para reducir con maximum.reduceat
+        self.nombres = list(dict.fromkeys(etiquetas))
+        orden = np.argsort([self.nombres.index(e) for e in etiquetas], kind="stable")
+        self._matriz = self._matriz[orden]
+        ordenadas = [etiquetas[i] for i in orden]
+        self._inicios = np.array([ordenadas.index(n) for n in self.nombres])
+
+    def clasificar(self, texto):
+        """Devuelve (intención, confianza) o (None, confianza) si no supera el umbral"""
+        umbral = self.umbral
+        if len(texto.split()) == 1:
+            if len(texto.strip()) < LONGITUD_MINIMA_DIFUSA:
+                return None, 0.0
+            umbral = max(umbral, UMBRAL_DIFUSO_PALABRA)
+        indices = [self._vocabulario[g] for g in ngramas(texto) if g in self._vocabulario]
+        if not indices or not self.nombres:
+            return None, 0.0
+        consulta = np.bincount(indices, minlength=len(self._idf)).astype(np.float32) * self._idf
+        consulta /= np.linalg.norm(consulta) + 1e-9
+        puntajes = np.maximum.reduceat(self._matriz @ consulta, self._inicios)
+        mejor = int(np.argmax(puntajes))
+        confianza = float(puntajes[mejor])
+        if confianza < umbral:
+            return None, confianza
+        return self.nombres[mejor], confianza
+
+
+class Interprete:
+    """Coincidencia exacta primero; si no hay, clasificación aproximada"""
+
+    def __init__(self, intenciones):
+        self.matcher = MatcherIntenciones(intenciones)
+        self.clasificador = ClasificadorDifuso(intenciones)
+
+    def interpretar(self, texto):
+        """Devuelve la Coincidencia para el texto o None"""
+        coincidencia = self.matcher.buscar(texto)
+        if coincidencia:
+            return coincidencia
+        nombre, confianza = self.clasificador.clasificar(texto)
+        if nombre:
+            return Coincidencia(nombre, {}, 0, confianza, aproximada=True)
+        return None
@@ -0,0 +1,80 @@
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# --- EJECUCIÓN DE COMANDOS POR LOTES ---
+
+
+def _ejecutar_medido(procesar, comando):
+    inicio = time.perf_counter()
+    try:
+        resultado = dict(procesar(comando))
+    except Exception as e:
+        resultado = {"comando": comando, "error": str(e)}
+    resultado["ms"] = round((time.perf_counter() - inicio) * 1000, 3)
+    return resultado
+
+
+def leer_comandos(entrada):
+    """Una orden por línea; se ignoran las vacías y los comentarios (#)"""
+    for linea in entrada:
+        comando = linea.strip()
+        if comando and not comando.startswith("#"):
+            yield comando
+
+
+def resumir_latencias(latencias, segundos):
+    """Conteo, percentiles y rendimiento de una serie de latencias en ms"""
+    if not latencias:
+        return {"comandos": 0, "segundos": round(segundos, 3)}
+    valores = np.asarray(latencias)
+    p50, p95, p99 = np.percentile(valores, [50, 95, 99])
+    return {
+        "comandos": len(valores),
+        "segundos": round(segundos, 3),
+        "comandos_por_segundo": round(len(valores) / segundos, 1) if segundos else None,
+        "promedio_ms": round(float(valores.mean()), 3),
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "max_ms": round(float(valores.max()), 3),
+    }
+
+
+def ejecutar_lote(entrada, procesar, salida=sys.stdout, concurrencia=1):
+    """Pasa cada línea de entrada por procesar(texto) -> dict y escribe una línea JSON por comando
+
+    Las respuestas salen en el mismo orden que las órdenes aunque se procesen
+    en paralelo; como mucho hay `concurrencia` comandos en curso, así que
+    también sirve para registros enormes o para escribir a mano.
+    Devuelve el resumen de latencias.
+    """
+    latencias = []
+    errores = no_reconocidos = 0
+    pendientes = deque()
+    inicio = time.perf_counter()
+
+    def escribir(resultado):
+        nonlocal errores, no_reconocidos
+        latencias.append(resultado["ms"])
+        errores += bool(resultado.get("error"))
+        no_reconocidos += resultado.get("intencion", True) is None
+        salida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+        salida.flush()
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrencia)) as executor:
+        for comando in leer_comandos(entrada):
+            pendientes.append(executor.submit(_ejecutar_medido, procesar, comando))
+            while pendientes and (len(pendientes) >= concurrencia or pendientes[0].done()):
+                escribir(pendientes.popleft().result())
+        while pendientes:
+            escribir(pendientes.popleft().result())
+
+    resumen = resumir_latencias(latencias, time.perf_counter() - inicio)
+    resumen["errores"] = errores
+    resumen["no_reconocidos"] = no_reconocidos
+    return resumen
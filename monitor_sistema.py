@@ -0,0 +1,237 @@
+import os
+import threading
+import time
+
+import numpy as np
+import psutil
+
+from intenciones import buscar_nombres, es_nombre_exacto, normalizar_nombre
+
+# --- MONITOR DE RECURSOS EN SEGUNDO PLANO ---
+INTERVALO_MUESTREO = 1.0  # Segundos entre muestras
+CAPACIDAD_MUESTRAS = 300  # 5 minutos a una muestra por segundo
+METRICAS = ["tiempo", "cpu", "ram", "disco", "red_enviado_kbps", "red_recibido_kbps", "procesos", "interfaces"]
+RAIZ_DISCO = os.path.abspath(os.sep)
+INTERVALO_PROCESOS = 3.0  # Segundos entre recorridos de la tabla de procesos
+
+
+class TablaProcesos:
+    """Uso de CPU y memoria por proceso con objetos psutil.Process persistentes
+
+    Cada Process guarda su tiempo de CPU anterior, así que cpu_percent(None)
+    da el uso desde el recorrido previo sin esperar. Solo se crean objetos
+    para los PID nuevos y se descartan los que terminaron; el índice de
+    nombres (nombre y ejecutable normalizados -> PID) se ajusta igual.
+    """
+
+    def __init__(self):
+        self._procesos = {}
+        self._denegados = set()  # PID sin permiso de lectura: no se reintentan
+        self._nucleos = psutil.cpu_count() or 1
+        self._nombres = {}  # PID -> nombre del proceso
+        self._claves = {}  # PID -> claves normalizadas con las que está indexado
+        self.indice = {}  # Clave normalizada -> PIDs
+        self._lock = threading.Lock()
+        # Última tabla publicada: (pids, nombres, cpu %, memoria en bytes)
+        self.tabla = (np.zeros(0, dtype=np.int64), [], np.zeros(0), np.zeros(0))
+        self.actualizado = 0.0
+
+    def _indexar(self, pid, proceso, nombre):
+        claves = {normalizar_nombre(nombre)}
+        try:
+            claves.add(normalizar_nombre(os.path.basename(proceso.exe())))
+        except (psutil.AccessDenied, psutil.ZombieProcess, OSError):
+            pass
+        claves.discard("")
+        with self._lock:
+            self._desindexar(pid)
+            self._nombres[pid] = nombre
+            self._claves[pid] = claves
+            for clave in claves:
+                self.indice.setdefault(clave, set()).add(pid)
+
+    def _desindexar(self, pid):
+        """Saca el PID del índice (con el lock tomado)"""
+        self._nombres.pop(pid, None)
+        for clave in self._claves.pop(pid, ()):
+            pids = self.indice.get(clave)
+            if pids is not None:
+                pids.discard(pid)
+                if not pids:
+                    del self.indice[clave]
+
+    def _quitar(self, pids):
+        with self._lock:
+            for pid in pids:
+                self._procesos.pop(pid, None)
+                self._desindexar(pid)
+
+    def actualizar(self):
+        """Recorre los procesos; solo lo llama el hilo del monitor
+
+        Las consultas de otros hilos leen la tabla publicada y el índice bajo
+        el lock; las llamadas a psutil se hacen fuera de él.
+        """
+        actuales = set(psutil.pids())
+        self._quitar(self._procesos.keys() - actuales)
+        self._denegados &= actuales
+        nuevos = {}
+        for pid in actuales - self._procesos.keys() - self._denegados:
+            try:
+                proceso = psutil.Process(pid)
+                proceso.cpu_percent(None)  # Primera lectura: fija la referencia
+                nuevos[pid] = proceso
+            except psutil.AccessDenied:
+                self._denegados.add(pid)
+            except psutil.NoSuchProcess:
+                pass
+        with self._lock:
+            self._procesos.update(nuevos)
+
+        pids, nombres, cpu, memoria, terminados = [], [], [], [], []
+        for pid, proceso in list(self._procesos.items()):
+            try:
+                with proceso.oneshot():
+                    uso = proceso.cpu_percent(None)
+                    residente = proceso.memory_info().rss
+                    nombre = proceso.name()
+                # Tras un exec el mismo PID cambia de nombre: solo entonces se reindexa
+                if self._nombres.get(pid) != nombre:
+                    self._indexar(pid, proceso, nombre)
+            except psutil.AccessDenied:
+                self._denegados.add(pid)
+                terminados.append(pid)
+                continue
+            except psutil.NoSuchProcess:
+                terminados.append(pid)
+                continue
+            pids.append(pid)
+            nombres.append(nombre)
+            cpu.append(uso)
+            memoria.append(residente)
+        self._quitar(terminados)
+        self.tabla = (np.array(pids, dtype=np.int64), nombres,
+                      np.array(cpu) / self._nucleos, np.array(memoria, dtype=np.float64))
+        self.actualizado = time.time()
+
+    def buscar(self, consulta):
+        """Procesos en ejecución que corresponden a un nombre dicho
+
+        Devuelve ({nombre: [Process]}, exacto); exacto es False si el nombre
+        solo se parece o coincide en parte (hay que confirmar antes de cerrar).
+        """
+        with self._lock:
+            claves = buscar_nombres(consulta, self.indice)
+            pids = set()
+            for clave in claves:
+                pids |= self.indice[clave]
+            pids.discard(os.getpid())  # EVA no se cierra a sí misma
+            encontrados = {}
+            for pid in sorted(pids):
+                if pid in self._procesos:
+                    encontrados.setdefault(self._nombres[pid], []).append(self._procesos[pid])
+        return encontrados, bool(claves) and es_nombre_exacto(consulta, claves[0])
+
+    def top(self, cantidad=5, por="cpu"):
+        """Los procesos que más consumen: lista de {pid, nombre, cpu, memoria_mb}"""
+        pids, nombres, cpu, memoria = self.tabla
+        valores = cpu if por == "cpu" else memoria
+        cantidad = min(cantidad, len(valores))
+        if cantidad == 0:
+            return []
+        # argpartition evita ordenar toda la tabla cuando hay miles de procesos
+        indices = np.argpartition(-valores, cantidad - 1)[:cantidad]
+        indices = indices[np.argsort(-valores[indices])]
+        return [{"pid": int(pids[i]), "nombre": nombres[i], "cpu": float(cpu[i]),
+                 "memoria_mb": float(memoria[i]) / 2**20} for i in indices]
+
+
+class MonitorSistema:
+    """Hilo que muestrea CPU, RAM, disco y red en un buffer circular (muestra x métrica)
+
+    La interfaz y los comandos leen la última muestra sin llamar a psutil,
+    así que nunca bloquean esperando a que se mida la CPU.
+    """
+
+    def __init__(self, intervalo=INTERVALO_MUESTREO, capacidad=CAPACIDAD_MUESTRAS):
+        self.intervalo = intervalo
+        self._columnas = {nombre: i for i, nombre in enumerate(METRICAS)}
+        self._datos = np.full((capacidad, len(METRICAS)), np.nan)
+        self._siguiente = 0
+        self.total = 0
+        self._red_anterior = None
+        self._lock = threading.Lock()
+        self._detener = threading.Event()
+        self._hilo = None
+        self.procesos = TablaProcesos()
+        self.intervalo_procesos = INTERVALO_PROCESOS
+
+    def iniciar(self):
+        if self._hilo is not None and self._hilo.is_alive():
+            return
+        self._detener.clear()
+        # Las primeras lecturas solo fijan la referencia de CPU y red
+        psutil.cpu_percent(interval=None)
+        self._red_anterior = (time.time(), psutil.net_io_counters())
+        self._hilo = threading.Thread(target=self._bucle, daemon=True, name="monitor")
+        self._hilo.start()
+
+    def detener(self):
+        self._detener.set()
+
+    def _bucle(self):
+        try:
+            self.procesos.actualizar()  # Primer recorrido de inmediato para "cierra" y "qué consume"
+        except Exception as e:
+            print(f"Error en monitor de sistema: {e}")
+        while not self._detener.wait(self.intervalo):
+            try:
+                self.muestrear()
+                if time.time() - self.procesos.actualizado >= self.intervalo_procesos:
+                    self.procesos.actualizar()
+            except Exception as e:
+                print(f"Error en monitor de sistema: {e}")
+
+    def muestrear(self):
+        """Toma una muestra y la agrega al buffer (la CPU se mide desde la muestra anterior)"""
+        ahora = time.time()
+        red = psutil.net_io_counters()
+        enviado = recibido = np.nan
+        if red is not None and self._red_anterior is not None:
+            tiempo_anterior, anterior = self._red_anterior
+            segundos = max(ahora - tiempo_anterior, 1e-6)
+            enviado = (red.bytes_sent - anterior.bytes_sent) / 1024 / segundos
+            recibido = (red.bytes_recv - anterior.bytes_recv) / 1024 / segundos
+        self._red_anterior = (ahora, red) if red is not None else None
+
+        fila = (ahora, psutil.cpu_percent(interval=None), psutil.virtual_memory().percent,
+                psutil.disk_usage(RAIZ_DISCO).percent, enviado, recibido, len(psutil.pids()),
+                sum(estado.isup for estado in psutil.net_if_stats().values()))
+        with self._lock:
+            self._datos[self._siguiente] = fila
+            self._siguiente = (self._siguiente + 1) % len(self._datos)
+            self.total += 1
+
+    def ultima(self):
+        """Última muestra como diccionario {métrica: valor}; mide una si aún no hay ninguna"""
+        if self.total == 0:
+            self.muestrear()
+        with self._lock:
+            fila = self._datos[self._siguiente - 1].copy()
+        return dict(zip(METRICAS, fila.tolist()))
+
+    def serie(self, metrica, cantidad=None):
+        """Valores recientes de una métrica, del más antiguo al más nuevo"""
+        return self.series(metrica, cantidad=cantidad)[0]
+
+    def series(self, *metricas, cantidad=None):
+        """Valores recientes de varias métricas leídos juntos (todas del mismo largo)"""
+        columnas = [self._columnas[metrica] for metrica in metricas]
+        with self._lock:
+            disponibles = min(self.total, len(self._datos))
+            cantidad = disponibles if cantidad is None else min(cantidad, disponibles)
+            indices = np.arange(self._siguiente - cantidad, self._siguiente) % len(self._datos)
+            return list(self._datos[np.ix_(indices, columnas)].T.copy())
+
+
+MONITOR = MonitorSistema()
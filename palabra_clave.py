@@ -0,0 +1,177 @@
+import os
+import threading
+
+import numpy as np
+
+# --- CONFIGURACIÓN DEL DETECTOR ---
+ARCHIVO_PLANTILLAS = "palabra_clave.npz"
+DURACION_TRAMA = 0.025  # Segundos por trama de análisis
+PASO_TRAMA = 0.010  # Segundos entre tramas consecutivas
+NUM_FILTROS_MEL = 26
+NUM_COEFICIENTES = 13
+HOLGURA_INICIO = 0.3  # Segundos tras el inicio de la voz en los que puede empezar la palabra
+FACTOR_UMBRAL = 1.6  # Margen sobre la distancia media entre muestras de entrenamiento
+
+_bancos_mel = {}
+
+
+def _hz_a_mel(hz):
+    return 2595.0 * np.log10(1.0 + hz / 700.0)
+
+
+def _mel_a_hz(mel):
+    return 700.0 * (10.0 ** (mel / 2595.0) - 1.0)
+
+
+def _banco_filtros(frecuencia, tamano_fft):
+    """Banco de filtros mel y matriz DCT, calculados una vez por configuración"""
+    clave = (frecuencia, tamano_fft)
+    if clave not in _bancos_mel:
+        puntos = _mel_a_hz(np.linspace(_hz_a_mel(0), _hz_a_mel(frecuencia / 2), NUM_FILTROS_MEL + 2))
+        bins = np.floor((tamano_fft + 1) * puntos / frecuencia).astype(int)
+        filtros = np.zeros((NUM_FILTROS_MEL, tamano_fft // 2 + 1))
+        for m in range(1, NUM_FILTROS_MEL + 1):
+            izq, centro, der = bins[m - 1], bins[m], bins[m + 1]
+            if centro > izq:
+                filtros[m - 1, izq:centro] = (np.arange(izq, centro) - izq) / (centro - izq)
+            if der > centro:
+                filtros[m - 1, centro:der] = (der - np.arange(centro, der)) / (der - centro)
+        n = np.arange(NUM_FILTROS_MEL)
+        dct = np.cos(np.pi / NUM_FILTROS_MEL * (n[None, :] + 0.5) * np.arange(NUM_COEFICIENTES)[:, None])
+        _bancos_mel[clave] = (filtros, dct)
+    return _bancos_mel[clave]
+
+
+def _tramas(muestras, frecuencia):
+    """Divide la señal en tramas solapadas con ventana de Hamming"""
+    largo = int(DURACION_TRAMA * frecuencia)
+    paso = int(PASO_TRAMA * frecuencia)
+    if len(muestras) < largo:
+        muestras = np.pad(muestras, (0, largo - len(muestras)))
+    num = 1 + (len(muestras) - largo) // paso
+    indices = np.arange(largo)[None, :] + paso * np.arange(num)[:, None]
+    return muestras[indices] * np.hamming(largo)
+
+
+def muestras_de_audio(audio):
+    """Convierte un sr.AudioData a un arreglo float de muestras mono"""
+    datos = audio.get_raw_data(convert_width=2)
+    return np.frombuffer(datos, dtype="<i2").astype(np.float32) / 32768.0, audio.sample_rate
+
+
+def caracteristicas_mfcc(muestras, frecuencia):
+    """MFCC sin el coeficiente de energía, una fila por trama"""
+    muestras = np.append(muestras[0:1], muestras[1:] - 0.97 * muestras[:-1])
+    tramas = _tramas(muestras, frecuencia)
+    tamano_fft = 1 << (tramas.shape[1] - 1).bit_length()
+    potencia = np.abs(np.fft.rfft(tramas, tamano_fft)) ** 2 / tamano_fft
+    filtros, dct = _banco_filtros(frecuencia, tamano_fft)
+    log_mel = np.log(potencia @ filtros.T + 1e-10)
+    return (log_mel @ dct.T)[:, 1:]
+
+
+def recortar_silencio_tramas(muestras, frecuencia, rango_db=30.0):
+    """Quita el silencio inicial y final usando la energía por trama
+
+    Devuelve las muestras recortadas y el índice de la primera muestra conservada.
+    """
+    energia = 10 * np.log10((_tramas(muestras, frecuencia) ** 2).mean(axis=1) + 1e-12)
+    voz = np.flatnonzero(energia > energia.max() - rango_db)
+    paso = int(PASO_TRAMA * frecuencia)
+    inicio, fin = voz[0] * paso, (voz[-1] + 1) * paso + int(DURACION_TRAMA * frecuencia)
+    return muestras[inicio:fin], inicio
+
+
+def distancia_dtw(plantilla, frase, holgura=None):
+    """DTW de subsecuencia: la plantilla puede empezar en las primeras tramas de la frase
+
+    Usa los pasos (1,1), (1,2) y (2,1), lo que limita la pendiente entre 1/2 y 2
+    y permite calcular cada fila de la matriz de forma vectorizada.
+    Devuelve la distancia normalizada y la trama de la frase donde termina la palabra.
+    """
+    n, m = len(plantilla), len(frase)
+    if n < 2 or m < n // 2:
+        return np.inf, m
+    # Coste local: distancia coseno entre tramas
+    a = plantilla / (np.linalg.norm(plantilla, axis=1, keepdims=True) + 1e-10)
+    b = frase / (np.linalg.norm(frase, axis=1, keepdims=True) + 1e-10)
+    coste = 1.0 - a @ b.T
+
+    acumulado = np.full((n, m + 2), np.inf)
+    # Dos columnas de relleno a la izquierda evitan comprobar índices negativos
+    holgura = m if holgura is None else min(holgura, m)
+    acumulado[0, 2:2 + holgura] = coste[0, :holgura]
+    for i in range(1, n):
+        mejor = np.minimum(acumulado[i - 1, 1:m + 1], acumulado[i - 1, 0:m])
+        if i >= 2:
+            mejor = np.minimum(mejor, acumulado[i - 2, 1:m + 1])
+        acumulado[i, 2:] = coste[i] + mejor
+    ultima = acumulado[n - 1, 2:]
+    fin = int(np.argmin(ultima))
+    return ultima[fin] / n, fin
+
+
+class DetectorPalabraClave:
+    """Detector local de la palabra de activación por plantillas MFCC + DTW"""
+
+    def __init__(self, archivo=ARCHIVO_PLANTILLAS):
+        self.archivo = archivo
+        self.palabra = None
+        self.plantillas = []
+        self.umbral = 0.0
+        self._lock = threading.Lock()
+        self.cargar()
+
+    def entrenado_para(self, palabra):
+        return bool(self.plantillas) and self.palabra == palabra
+
+    def cargar(self):
+        """Carga las plantillas grabadas previamente, si existen"""
+        if not os.path.exists(self.archivo):
+            return
+        try:
+            with np.load(self.archivo) as datos:
+                self.palabra = str(datos["palabra"])
+                self.umbral = float(datos["umbral"])
+                self.plantillas = [datos[k] for k in sorted(datos.files) if k.startswith("plantilla_")]
+        except Exception as e:
+            print(f"No se pudieron cargar las plantillas de activación: {e}")
+
+    def entrenar(self, palabra, audios):
+        """Crea plantillas a partir de varias grabaciones de la palabra"""
+        plantillas = []
+        for audio in audios:
+            muestras, frecuencia = muestras_de_audio(audio)
+            voz, _ = recortar_silencio_tramas(muestras, frecuencia)
+            plantillas.append(caracteristicas_mfcc(voz, frecuencia))
+        if len(plantillas) < 2:
+            raise ValueError("Se necesitan al menos dos muestras de la palabra")
+
+        # El umbral se deriva de lo parecidas que son las muestras entre sí
+        distancias = [distancia_dtw(a, b)[0] for i, a in enumerate(plantillas)
+                      for j, b in enumerate(plantillas) if i != j]
+        umbral = float(np.mean(distancias)) * FACTOR_UMBRAL
+
+        with self._lock:
+            self.palabra, self.plantillas, self.umbral = palabra, plantillas, umbral
+        arreglos = {f"plantilla_{i}": p for i, p in enumerate(plantillas)}
+        np.savez(self.archivo, palabra=palabra, umbral=umbral, **arreglos)
+        return umbral
+
+    def detectar(self, audio):
+        """Busca la palabra al inicio de la frase
+
+        Devuelve (detectada, segundo en que termina la palabra, distancia).
+        """
+        with self._lock:
+            plantillas, umbral = self.plantillas, self.umbral
+        muestras, frecuencia = muestras_de_audio(audio)
+        voz, inicio = recortar_silencio_tramas(muestras, frecuencia)
+        frase = caracteristicas_mfcc(voz, frecuencia)
+        holgura = int(HOLGURA_INICIO / PASO_TRAMA)
+        mejor, fin = np.inf, 0
+        for plantilla in plantillas:
+            distancia, trama_fin = distancia_dtw(plantilla, frase, holgura)
+            if distancia < mejor:
+                mejor, fin = distancia, trama_fin
+        return bool(mejor <= umbral), inicio / frecuencia + (fin + 1) * PASO_TRAMA, mejor
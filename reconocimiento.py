@@ -0,0 +1,265 @@
+import audioop
+import hashlib
+import json
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import speech_recognition as sr
+
+# --- MOTORES DE RECONOCIMIENTO DE VOZ ---
+FRECUENCIA_CANONICA = 16000  # Formato común para comparar y alimentar motores locales
+ANCHO_CANONICO = 2
+BYTES_HUELLA = 6400  # 0.2 s de audio canónico para identificar grabaciones
+MOTORES = ["google", "vosk", "sphinx", "replay"]
+
+
+def datos_canonicos(audio):
+    """Bytes PCM del audio a 16 kHz y 16 bits"""
+    return audio.get_raw_data(convert_rate=FRECUENCIA_CANONICA, convert_width=ANCHO_CANONICO)
+
+
+class FlujoReconocimiento:
+    """Reconocimiento incremental: recibe bloques PCM mientras el usuario habla
+
+    Esta versión solo acumula el audio y lo reconoce al final; los motores
+    con resultados parciales la reemplazan.
+    """
+
+    def __init__(self, reconocedor, frecuencia, ancho):
+        self.reconocedor = reconocedor
+        self.frecuencia = frecuencia
+        self.ancho = ancho
+        self.datos = bytearray()
+
+    def alimentar(self, bloque):
+        """Agrega un bloque y devuelve la hipótesis parcial actual (o None)"""
+        self.datos.extend(bloque)
+        return None
+
+    def finalizar(self):
+        """Texto definitivo de todo lo recibido"""
+        return self.reconocedor.reconocer(sr.AudioData(bytes(self.datos), self.frecuencia, self.ancho))
+
+
+class ReconocedorBase:
+    """Interfaz común: recibe un sr.AudioData y devuelve el texto reconocido
+
+    Los motores lanzan sr.UnknownValueError si no entienden el audio y
+    sr.RequestError si el propio motor falla.
+    """
+    nombre = "base"
+    soporta_parciales = False
+
+    def reconocer(self, audio):
+        raise NotImplementedError
+
+    def iniciar_flujo(self, frecuencia, ancho):
+        """Crea un flujo incremental para una nueva frase"""
+        return FlujoReconocimiento(self, frecuencia, ancho)
+
+
+class ReconocedorGoogle(ReconocedorBase):
+    """Reconocimiento en la nube con la API web de Google"""
+    nombre = "google"
+
+    def __init__(self, listener, idioma="es-CO", timeout=5):
+        self.listener = listener
+        self.idioma = idioma
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=2)
+
+    def reconocer(self, audio):
+        # La petición va en otro hilo para poder cortar respuestas lentas
+        future = self._executor.submit(self.listener.recognize_google, audio, language=self.idioma)
+        return future.result(timeout=self.timeout)
+
+
+class ReconocedorVosk(ReconocedorBase):
+    """Reconocimiento local con un modelo de Vosk descargado en disco"""
+    nombre = "vosk"
+
+    def __init__(self, ruta_modelo="modelos/vosk-es"):
+        try:
+            import vosk
+        except ImportError:
+            raise sr.RequestError("Falta el módulo vosk; instala con: pip install vosk")
+        if not os.path.isdir(ruta_modelo):
+            raise sr.RequestError(f"No existe el modelo de Vosk en '{ruta_modelo}'")
+        vosk.SetLogLevel(-1)
+        self._vosk = vosk
+        self.modelo = vosk.Model(ruta_modelo)
+
+    soporta_parciales = True
+
+    def iniciar_flujo(self, frecuencia, ancho):
+        return FlujoVosk(self, frecuencia, ancho)
+
+    def reconocer(self, audio):
+        reconocedor = self._vosk.KaldiRecognizer(self.modelo, FRECUENCIA_CANONICA)
+        reconocedor.AcceptWaveform(datos_canonicos(audio))
+        texto = json.loads(reconocedor.FinalResult()).get("text", "")
+        if not texto:
+            raise sr.UnknownValueError()
+        return texto
+
+
+class FlujoVosk(FlujoReconocimiento):
+    """Flujo con las hipótesis parciales nativas de Vosk"""
+
+    def __init__(self, reconocedor, frecuencia, ancho):
+        super().__init__(reconocedor, frecuencia, ancho)
+        self._kaldi = reconocedor._vosk.KaldiRecognizer(reconocedor.modelo, frecuencia)
+        self._confirmado = []  # Segmentos que Vosk ya dio por terminados
+
+    def alimentar(self, bloque):
+        if self.ancho != 2:
+            bloque = sr.AudioData(bloque, self.frecuencia, self.ancho).get_raw_data(convert_width=2)
+        if self._kaldi.AcceptWaveform(bloque):
+            texto = json.loads(self._kaldi.Result()).get("text", "")
+            if texto:
+                self._confirmado.append(texto)
+            parcial = ""
+        else:
+            parcial = json.loads(self._kaldi.PartialResult()).get("partial", "")
+        return " ".join(self._confirmado + ([parcial] if parcial else [])) or None
+
+    def finalizar(self):
+        texto = json.loads(self._kaldi.FinalResult()).get("text", "")
+        texto = " ".join(self._confirmado + ([texto] if texto else []))
+        if not texto:
+            raise sr.UnknownValueError()
+        return texto
+
+
+class ReconocedorSphinx(ReconocedorBase):
+    """Reconocimiento local con PocketSphinx
+
+    ruta_modelo puede ser un código de idioma instalado en speech_recognition
+    o una carpeta con acoustic-model/, language-model.lm.bin y
+    pronounciation-dictionary.dict (la misma estructura que usa speech_recognition).
+    """
+    nombre = "sphinx"
+
+    def __init__(self, listener, ruta_modelo="es-ES"):
+        self.listener = listener
+        if os.path.isdir(ruta_modelo):
+            self.idioma = (os.path.join(ruta_modelo, "acoustic-model"),
+                           os.path.join(ruta_modelo, "language-model.lm.bin"),
+                           os.path.join(ruta_modelo, "pronounciation-dictionary.dict"))
+        else:
+            self.idioma = ruta_modelo
+
+    def reconocer(self, audio):
+        return self.listener.recognize_sphinx(audio, language=self.idioma)
+
+
+class ReconocedorReplay(ReconocedorBase):
+    """Motor determinista que asocia grabaciones WAV con transcripciones conocidas
+
+    La carpeta contiene archivos .wav y, para cada uno, un .txt con el mismo
+    nombre o una entrada en transcripciones.json ({"archivo.wav": "texto"}).
+    Un audio se reconoce si coincide con una grabación o si comparte con ella
+    un tramo de voz (el VAD recorta silencios y la captura agrega pre-roll).
+    """
+    nombre = "replay"
+    soporta_parciales = True
+
+    def __init__(self, carpeta="fixtures"):
+        if not os.path.isdir(carpeta):
+            raise sr.RequestError(f"No existe la carpeta de grabaciones '{carpeta}'")
+        self.carpeta = carpeta
+        self.grabaciones = []  # Lista de (bytes canónicos, transcripción)
+        self._por_hash = {}
+
+        indice = {}
+        ruta_indice = os.path.join(carpeta, "transcripciones.json")
+        if os.path.exists(ruta_indice):
+            with open(ruta_indice, 'r', encoding='utf-8') as f:
+                indice = json.load(f)
+
+        for archivo in sorted(os.listdir(carpeta)):
+            if not archivo.lower().endswith(".wav"):
+                continue
+            texto = indice.get(archivo)
+            ruta_txt = os.path.join(carpeta, os.path.splitext(archivo)[0] + ".txt")
+            if texto is None and os.path.exists(ruta_txt):
+                with open(ruta_txt, 'r', encoding='utf-8') as f:
+                    texto = f.read().strip()
+            if texto is None:
+                continue
+            with sr.AudioFile(os.path.join(carpeta, archivo)) as fuente:
+                datos = datos_canonicos(sr.Recognizer().record(fuente))
+            self.grabaciones.append((datos, texto))
+            self._por_hash[hashlib.sha1(datos).hexdigest()] = texto
+
+    def reconocer(self, audio):
+        datos = datos_canonicos(audio)
+        texto = self._por_hash.get(hashlib.sha1(datos).hexdigest())
+        if texto is not None:
+            return texto
+        # Fragmentos recortados o grabaciones con relleno alrededor
+        encontrada = self.buscar_grabacion(datos)
+        if encontrada:
+            return encontrada[1]
+        raise sr.UnknownValueError()
+
+    def buscar_grabacion(self, datos):
+        """Grabación de la que provienen estos datos: (original, texto, desplazamiento)
+
+        Se busca el tramo de 0.2 s con más energía (el silencio se repite en
+        todas las grabaciones); el desplazamiento es la posición de datos[0]
+        dentro de la grabación y puede ser negativo si hay audio previo.
+        """
+        mejor, posicion = 0, None
+        paso = BYTES_HUELLA // 2
+        for i in range(0, len(datos) - BYTES_HUELLA + 1, paso):
+            energia = audioop.rms(datos[i:i + BYTES_HUELLA], ANCHO_CANONICO)
+            if energia > mejor:
+                mejor, posicion = energia, i
+        if posicion is None:
+            return None
+        huella = datos[posicion:posicion + BYTES_HUELLA]
+        for original, texto in self.grabaciones:
+            encontrada = original.find(huella)
+            if encontrada >= 0:
+                return original, texto, encontrada - posicion
+        return None
+
+    def iniciar_flujo(self, frecuencia, ancho):
+        return FlujoReplay(self, frecuencia, ancho)
+
+
+class FlujoReplay(FlujoReconocimiento):
+    """Simula resultados parciales revelando palabras según el audio recibido"""
+
+    def __init__(self, reconocedor, frecuencia, ancho):
+        super().__init__(reconocedor, frecuencia, ancho)
+        self._grabacion = None
+
+    def alimentar(self, bloque):
+        super().alimentar(bloque)
+        # Bytes recibidos expresados en el formato canónico de las grabaciones
+        recibidos = int(len(self.datos) * FRECUENCIA_CANONICA / self.frecuencia * ANCHO_CANONICO / self.ancho)
+        if self._grabacion is None and recibidos >= BYTES_HUELLA:
+            datos = datos_canonicos(sr.AudioData(bytes(self.datos), self.frecuencia, self.ancho))
+            self._grabacion = self.reconocedor.buscar_grabacion(datos)
+        if not self._grabacion:
+            return None
+        original, texto, desplazamiento = self._grabacion
+        palabras = texto.split()
+        avance = min(1.0, max(0, desplazamiento + recibidos) / len(original))
+        return " ".join(palabras[:math.ceil(avance * len(palabras))]) or None
+
+
+def crear_reconocedor(nombre, listener, ruta_modelo=None):
+    """Construye el motor indicado por nombre (google, vosk, sphinx o replay)"""
+    if nombre == "google":
+        return ReconocedorGoogle(listener)
+    if nombre == "vosk":
+        return ReconocedorVosk(ruta_modelo) if ruta_modelo else ReconocedorVosk()
+    if nombre == "sphinx":
+        return ReconocedorSphinx(listener, ruta_modelo) if ruta_modelo else ReconocedorSphinx(listener)
+    if nombre == "replay":
+        return ReconocedorReplay(ruta_modelo) if ruta_modelo else ReconocedorReplay()
+    raise ValueError(f"Motor de reconocimiento desconocido: {nombre}")
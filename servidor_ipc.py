@@ -0,0 +1,66 @@
+import json
+import os
+import socket
+import socketserver
+import stat
+import tempfile
+import time
+
+# --- SERVIDOR DE COMANDOS POR SOCKET LOCAL ---
+RUTA_SOCKET = os.path.join(tempfile.gettempdir(), f"eva-{os.getuid() if hasattr(os, 'getuid') else 0}.sock")
+
+
+class ManejadorComandos(socketserver.StreamRequestHandler):
+    """Un comando de texto por línea; cada respuesta es una línea JSON"""
+
+    def handle(self):
+        for linea in self.rfile:
+            comando = linea.decode("utf-8", errors="replace").strip()
+            if not comando:
+                continue
+            inicio = time.perf_counter()
+            try:
+                resultado = dict(self.server.procesar(comando))
+            except Exception as e:
+                resultado = {"comando": comando, "error": str(e)}
+            resultado["ms"] = round((time.perf_counter() - inicio) * 1000, 3)
+            try:
+                self.wfile.write((json.dumps(resultado, ensure_ascii=False) + "\n").encode("utf-8"))
+                self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                return  # El cliente cerró sin esperar la respuesta
+
+
+class ServidorComandos(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Socket Unix que pasa cada comando recibido a procesar(texto) -> dict
+
+    Cada conexión se atiende en su propio hilo y sus comandos se responden
+    en orden, así que un cliente puede enviar muchos seguidos sin esperar.
+    """
+    daemon_threads = True
+
+    def __init__(self, procesar, ruta=RUTA_SOCKET):
+        self.procesar = procesar
+        self.ruta = ruta
+        # Un socket que quedó de una ejecución anterior impide volver a enlazar
+        if os.path.exists(ruta) and stat.S_ISSOCK(os.stat(ruta).st_mode):
+            os.unlink(ruta)
+        super().__init__(ruta, ManejadorComandos)
+        os.chmod(ruta, 0o600)  # Solo el usuario que lanzó EVA puede enviarle órdenes
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.ruta)
+        except FileNotFoundError:
+            pass
+
+
+def enviar_comando(comando, ruta=RUTA_SOCKET, timeout=30):
+    """Envía un comando a un daemon en ejecución y devuelve su respuesta decodificada"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conexion:
+        conexion.settimeout(timeout)
+        conexion.connect(ruta)
+        conexion.sendall((comando.strip() + "\n").encode("utf-8"))
+        with conexion.makefile("rb") as respuesta:
+            return json.loads(respuesta.readline())
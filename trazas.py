@@ -0,0 +1,109 @@
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+# --- TRAZAS DE LATENCIA POR INTERACCIÓN ---
+ETAPAS = ["captura", "vad", "reconocimiento", "intencion", "manejador", "sintesis", "reproduccion", "total"]
+CAPACIDAD_TRAZAS = 500  # Interacciones recientes que se conservan
+
+
+class Traza:
+    """Duraciones (ms) de las etapas de una interacción
+
+    "total" va desde que el usuario deja de hablar (o desde que llega el
+    comando de texto) hasta que EVA empieza a sonar. Sin registro, la traza
+    se mide pero no se guarda.
+    """
+
+    def __init__(self, registro=None):
+        self.registro = registro
+        self.duraciones = {}
+        self.fin_habla = time.perf_counter()
+        self.inicio_habla = None
+        self._cerrada = False
+
+    @contextmanager
+    def etapa(self, nombre):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.agregar(nombre, (time.perf_counter() - inicio) * 1000)
+
+    def agregar(self, nombre, ms):
+        self.duraciones[nombre] = self.duraciones.get(nombre, 0.0) + ms
+
+    def marcar_inicio_habla(self):
+        self.inicio_habla = time.perf_counter()
+
+    def marcar_fin_habla(self):
+        """El usuario terminó la frase: cierra la etapa de captura"""
+        self.fin_habla = time.perf_counter()
+        if self.inicio_habla is not None:
+            self.agregar("captura", (self.fin_habla - self.inicio_habla) * 1000)
+
+    def cerrar_con_voz(self, mensaje):
+        """Callback de TrabajadorVoz: agrega síntesis, reproducción y total"""
+        if mensaje.despachado and mensaje.inicio_audio:
+            self.agregar("sintesis", (mensaje.inicio_audio - mensaje.despachado) * 1000)
+            self.agregar("reproduccion", (mensaje.fin - mensaje.inicio_audio) * 1000)
+            self.agregar("total", (mensaje.inicio_audio - self.fin_habla) * 1000)
+        self.finalizar()
+
+    def finalizar(self):
+        """Guarda la traza en su registro (solo la primera vez)"""
+        if self._cerrada:
+            return
+        self._cerrada = True
+        if self.registro is not None:
+            self.registro.registrar(self)
+
+
+class RegistroTrazas:
+    """Buffer circular de trazas en un arreglo (interacción x etapa, NaN si no aplica)"""
+
+    def __init__(self, capacidad=CAPACIDAD_TRAZAS, etapas=ETAPAS):
+        self.etapas = list(etapas)
+        self._columnas = {nombre: i for i, nombre in enumerate(self.etapas)}
+        self._datos = np.full((capacidad, len(self.etapas)), np.nan)
+        self._siguiente = 0
+        self.total = 0
+        self._lock = threading.Lock()
+
+    def nueva(self):
+        return Traza(self)
+
+    def registrar(self, traza):
+        fila = np.full(len(self.etapas), np.nan)
+        for nombre, ms in traza.duraciones.items():
+            if nombre in self._columnas:
+                fila[self._columnas[nombre]] = ms
+        with self._lock:
+            self._datos[self._siguiente] = fila
+            self._siguiente = (self._siguiente + 1) % len(self._datos)
+            self.total += 1
+
+    def percentiles(self):
+        """{etapa: {muestras, p50, p95, p99}} de las etapas con datos"""
+        with self._lock:
+            datos = self._datos[:min(self.total, len(self._datos))].copy()
+        resultado = {}
+        for nombre, columna in zip(self.etapas, datos.T):
+            valores = columna[~np.isnan(columna)]
+            if len(valores):
+                p50, p95, p99 = np.percentile(valores, [50, 95, 99])
+                resultado[nombre] = {"muestras": len(valores), "p50": p50, "p95": p95, "p99": p99}
+        return resultado
+
+    def texto(self):
+        """Tabla legible de percentiles por etapa"""
+        lineas = [f"{'etapa':<15}{'p50':>9}{'p95':>9}{'p99':>9}{'n':>6}"]
+        for nombre, datos in self.percentiles().items():
+            lineas.append(f"{nombre:<15}{datos['p50']:>9.1f}{datos['p95']:>9.1f}"
+                          f"{datos['p99']:>9.1f}{datos['muestras']:>6}")
+        return "\n".join(lineas) if len(lineas) > 1 else "Sin interacciones medidas todavía"
+
+
+TRAZAS = RegistroTrazas()
@@ -0,0 +1,46 @@
+import numpy as np
+import speech_recognition as sr
+
+# --- DETECTOR DE ACTIVIDAD DE VOZ ---
+DURACION_TRAMA = 0.02  # Segundos por trama de análisis
+MARGEN = 0.15  # Segundos de silencio que se conservan alrededor de cada tramo de voz
+
+
+def energia_tramas(muestras, frecuencia, duracion_trama=DURACION_TRAMA):
+    """Energía RMS de cada trama (misma escala que audioop.rms)"""
+    largo = max(1, int(frecuencia * duracion_trama))
+    num = len(muestras) // largo
+    tramas = muestras[:num * largo].reshape(num, largo).astype(np.float32)
+    return np.sqrt((tramas * tramas).mean(axis=1)), largo
+
+
+def recortar_silencio(audio, umbral_rms, margen=MARGEN, duracion_trama=DURACION_TRAMA):
+    """Quita el silencio inicial, final y las pausas largas de una frase
+
+    Las pausas internas se reducen a dos veces el margen. Devuelve el audio
+    recortado (None si no hay voz) y un diccionario con lo que se ahorró.
+    """
+    muestras = np.frombuffer(audio.get_raw_data(convert_width=2), dtype="<i2")
+    rms, largo = energia_tramas(muestras, audio.sample_rate, duracion_trama)
+    voz = rms > umbral_rms
+
+    # Dilatar cada trama con voz para conservar los bordes de las palabras
+    k = int(margen / duracion_trama)
+    conservar = voz
+    if voz.any():
+        conservar = np.convolve(voz, np.ones(2 * k + 1))[k:k + len(voz)] > 0
+    mascara = np.repeat(conservar, largo)
+    recortado = muestras[:len(mascara)][mascara]
+
+    ancho = audio.sample_width
+    ahorro = {
+        "bytes_originales": len(audio.frame_data),
+        "bytes_ahorrados": (len(muestras) - len(recortado)) * ancho,
+        "ms_ahorrados": (len(muestras) - len(recortado)) * 1000.0 / audio.sample_rate,
+    }
+    if not voz.any():
+        return None, ahorro
+    resultado = sr.AudioData(recortado.astype("<i2").tobytes(), audio.sample_rate, 2)
+    if ancho != 2:
+        resultado = sr.AudioData(resultado.get_raw_data(convert_width=ancho), audio.sample_rate, ancho)
+    return resultado, ahorro
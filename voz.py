@@ -0,0 +1,523 @@
+import hashlib
+import heapq
+import itertools
+import math
+import multiprocessing as mp
+import os
+import queue
+import re
+import threading
+import time
+import wave
+from array import array
+
+# --- CONFIGURACIÓN DE VOZ ---
+CADUCIDAD = 10  # Segundos tras los cuales un mensaje no prioritario ya no se dice
+ESPERA_INTERRUPCION = 1.5  # Segundos para que el motor se detenga antes de reiniciarlo
+DURACION_MAXIMA = 60  # Segundos máximos por mensaje antes de considerar colgado el motor
+CARPETA_CACHE = os.path.join(os.path.expanduser('~'), ".eva_cache", "voz")
+TAMANO_CACHE = 20 * 1024 * 1024  # Bytes máximos de audio pre-renderizado
+EARCON = "<earcon>"  # Mensaje especial: tono corto de confirmación en lugar de voz
+
+
+class CacheVoz:
+    """Caché en disco de frases ya sintetizadas, con expulsión LRU por tamaño
+
+    La clave combina texto, voz, velocidad y volumen; la fecha de modificación
+    de cada archivo marca su último uso.
+    """
+
+    def __init__(self, carpeta, configuracion, tamano_maximo=TAMANO_CACHE):
+        self.carpeta = carpeta
+        self.configuracion = configuracion
+        self.tamano_maximo = tamano_maximo
+        os.makedirs(carpeta, exist_ok=True)
+
+    def ruta(self, texto):
+        clave = hashlib.sha1(f"{texto}|{self.configuracion}".encode("utf-8")).hexdigest()
+        return os.path.join(self.carpeta, f"{clave}.wav")
+
+    def contiene(self, texto):
+        return os.path.exists(self.ruta(texto))
+
+    def obtener(self, texto):
+        """Ruta del audio si está en caché (y lo marca como recién usado)"""
+        ruta = self.ruta(texto)
+        try:
+            os.utime(ruta)
+            return ruta
+        except OSError:
+            return None
+
+    def renderizar(self, engine, texto, destino=None):
+        """Sintetiza el texto a un WAV de la caché (o al destino indicado)"""
+        ruta = destino or self.ruta(texto)
+        temporal = ruta + ".tmp"
+        try:
+            engine.save_to_file(texto, temporal)
+            engine.runAndWait()
+            wave.open(temporal, 'rb').close()  # Algunos motores no generan WAV
+            os.replace(temporal, ruta)
+        except Exception as e:
+            print(f"No se pudo pre-renderizar '{texto}': {e}")
+            if os.path.exists(temporal):
+                os.remove(temporal)
+            return None
+        if not destino:
+            self._recortar()
+        return ruta
+
+    def _recortar(self):
+        """Borra los archivos usados hace más tiempo hasta respetar el tamaño máximo"""
+        archivos = []
+        for nombre in os.listdir(self.carpeta):
+            if nombre.endswith(".wav"):
+                info = os.stat(os.path.join(self.carpeta, nombre))
+                archivos.append((info.st_mtime, info.st_size, nombre))
+        total = sum(tamano for _, tamano, _ in archivos)
+        for _, tamano, nombre in sorted(archivos):
+            if total <= self.tamano_maximo:
+                break
+            os.remove(os.path.join(self.carpeta, nombre))
+            total -= tamano
+
+
+_salida_audio = None
+
+
+def generar_earcon(ruta, frecuencia=16000):
+    """Crea un tono corto de dos notas para confirmar la activación"""
+    muestras = array('h')
+    rampa = 0.01 * frecuencia  # Subida y bajada suaves para evitar chasquidos
+    for nota in (880, 1320):
+        n = int(0.07 * frecuencia)
+        for i in range(n):
+            envolvente = min(1.0, i / rampa, (n - i) / rampa)
+            muestras.append(int(12000 * envolvente * math.sin(2 * math.pi * nota * i / frecuencia)))
+    with wave.open(ruta, 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(frecuencia)
+        wf.writeframes(muestras.tobytes())
+    return ruta
+
+
+def puede_reproducir():
+    """Indica si hay salida de audio para reproducir WAV"""
+    try:
+        import pyaudio  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def dividir_oraciones(texto):
+    """Separa un texto en oraciones o líneas que se pueden decir por separado"""
+    partes = re.split(r"(?<=[.!?;])\s+|\n+", texto)
+    return [p.strip(" -•\t") for p in partes if p.strip(" -•\t")]
+
+
+def decir_por_oraciones(engine, cache, oraciones, interrumpir, al_sonar=None):
+    """Sintetiza la oración siguiente mientras se reproduce la actual
+
+    Si una oración no se puede renderizar o reproducir, desde ahí el resto se
+    dice con engine.say al final (pyttsx3 no admite dos hilos a la vez).
+    """
+    listas = queue.Queue(maxsize=2)
+    fallo = threading.Event()
+    por_decir = []  # Oraciones que no sonaron, en orden
+
+    def reproducir():
+        while True:
+            elemento = listas.get()
+            if elemento is None:
+                break
+            ruta, temporal, oracion = elemento
+            try:
+                if fallo.is_set() or ruta is None:
+                    fallo.set()
+                    por_decir.append(oracion)
+                elif not interrumpir.is_set():
+                    reproducir_wav(ruta, interrumpir, al_sonar)
+            except Exception as e:
+                print(f"Error reproduciendo audio, se usará el motor de voz: {e}")
+                fallo.set()
+                por_decir.append(oracion)
+            finally:
+                if temporal and ruta and os.path.exists(ruta):
+                    os.remove(ruta)
+
+    hilo = threading.Thread(target=reproducir, daemon=True)
+    hilo.start()
+    restantes = []
+    for i, oracion in enumerate(oraciones):
+        if interrumpir.is_set():
+            break
+        if fallo.is_set():
+            restantes = oraciones[i:]
+            break
+        ruta = cache.obtener(oracion)
+        if ruta:
+            listas.put((ruta, False, oracion))
+            continue
+        ruta = cache.renderizar(engine, oracion, destino=os.path.join(cache.carpeta, f"parte_{os.getpid()}_{i}.wav"))
+        listas.put((ruta, True, oracion))
+    listas.put(None)
+    hilo.join()
+
+    if por_decir or restantes:
+        if interrumpir.is_set():
+            return
+        if al_sonar:
+            al_sonar()
+        for oracion in por_decir + restantes:
+            engine.say(oracion)
+        engine.runAndWait()
+
+
+def reproducir_wav(ruta, interrumpir, al_sonar=None):
+    """Reproduce un WAV por bloques para poder cortarlo en cualquier momento"""
+    global _salida_audio
+    import pyaudio
+
+    if _salida_audio is None:
+        _salida_audio = pyaudio.PyAudio()
+    with wave.open(ruta, 'rb') as wf:
+        flujo = _salida_audio.open(format=_salida_audio.get_format_from_width(wf.getsampwidth()),
+                                   channels=wf.getnchannels(), rate=wf.getframerate(), output=True)
+        if al_sonar:
+            al_sonar()
+        try:
+            while not interrumpir.is_set():
+                datos = wf.readframes(1024)
+                if not datos:
+                    break
+                flujo.write(datos)
+        finally:
+            flujo.stop_stream()
+            flujo.close()
+
+
+def _decir(engine, cache, texto, interrumpir, hay_salida_audio, al_sonar=None):
+    """Dice un texto por la vía más rápida disponible
+
+    al_sonar se llama cuando empieza el audio; si habla pyttsx3 directamente,
+    justo antes de say (síntesis y reproducción no se pueden separar).
+    """
+    if texto == EARCON:
+        if hay_salida_audio:
+            ruta = os.path.join(cache.carpeta, "earcon.wav")
+            try:
+                reproducir_wav(ruta if os.path.exists(ruta) else generar_earcon(ruta), interrumpir, al_sonar)
+                return
+            except Exception as e:
+                print(f"Error reproduciendo audio, se usará el motor de voz: {e}")
+        if al_sonar:
+            al_sonar()
+        engine.say("¿Sí?")
+        engine.runAndWait()
+        return
+    if hay_salida_audio:
+        ruta = cache.obtener(texto)
+        if ruta:
+            try:
+                reproducir_wav(ruta, interrumpir, al_sonar)
+                return
+            except Exception as e:
+                # Sin dispositivo de salida (u ocupado): la frase se dice igual con el motor
+                print(f"Error reproduciendo audio, se usará el motor de voz: {e}")
+        else:
+            oraciones = dividir_oraciones(texto)
+            if len(oraciones) > 1:
+                # Textos largos: el primer audio llega tras sintetizar solo una oración
+                decir_por_oraciones(engine, cache, oraciones, interrumpir, al_sonar)
+                return
+    if al_sonar:
+        al_sonar()
+    engine.say(texto)
+    engine.runAndWait()
+
+
+class Interrupcion:
+    """Vista, para un mensaje, del identificador compartido del mensaje a cortar
+
+    Solo está activa si el corte va dirigido a ese mensaje: un corte que llega
+    mientras se pre-renderiza una frase fija, o destinado a un mensaje que ya
+    terminó, no afecta al siguiente.
+    """
+
+    def __init__(self, compartido, identificador):
+        self.compartido = compartido
+        self.identificador = identificador
+
+    def is_set(self):
+        return self.compartido.value == self.identificador
+
+
+def _proceso_voz(entrada, salida, interrumpir, velocidad, volumen, indice_voz, carpeta_cache, frases_fijas):
+    """Proceso dedicado: único dueño del motor pyttsx3"""
+    import pyttsx3
+
+    engine = pyttsx3.init()
+    engine.setProperty('rate', velocidad)
+    engine.setProperty('volume', volumen)
+    voices = engine.getProperty('voices')
+    if len(voices) > indice_voz:
+        engine.setProperty('voice', voices[indice_voz].id)
+
+    cache = CacheVoz(carpeta_cache, f"{engine.getProperty('voice')}|{velocidad}|{volumen}")
+    hay_salida_audio = puede_reproducir()
+    # Las frases fijas se renderizan mientras el proceso está libre
+    por_calentar = [frase for frase in frases_fijas if not cache.contiene(frase)]
+
+    # Aviso de "empezó a sonar" (una vez por mensaje) para medir la latencia;
+    # "corte" es la interrupción del mensaje en curso (None al pre-renderizar)
+    actual = {"id": None, "corte": None}
+
+    # pyttsx3 solo permite detener el habla de forma segura desde sus callbacks
+    def al_empezar_palabra(name, location, length):
+        if actual["corte"] is not None and actual["corte"].is_set():
+            engine.stop()
+
+    engine.connect('started-word', al_empezar_palabra)
+
+    def al_sonar():
+        if actual["id"] is not None:
+            salida.put((actual["id"], "inicio"))
+            actual["id"] = None
+
+    while True:
+        try:
+            mensaje = entrada.get(timeout=0.1 if por_calentar else None)
+        except queue.Empty:
+            cache.renderizar(engine, por_calentar.pop(0))
+            continue
+        if mensaje is None:
+            break
+        identificador, texto = mensaje
+        actual["id"] = identificador
+        actual["corte"] = Interrupcion(interrumpir, identificador)
+        try:
+            _decir(engine, cache, texto, actual["corte"], hay_salida_audio, al_sonar)
+        except Exception as e:
+            print(f"Error en el motor de voz: {e}")
+        actual["id"] = actual["corte"] = None
+        salida.put((identificador, "fin"))
+
+
+class Mensaje:
+    def __init__(self, identificador, texto, prioritario):
+        self.id = identificador
+        self.texto = texto
+        self.prioritario = prioritario
+        self.creado = time.time()
+        self.terminado = threading.Event()
+        # Instantes (time.perf_counter) para medir la latencia de la respuesta
+        self.despachado = None  # Entregado al proceso de voz
+        self.inicio_audio = None  # Empezó a sonar
+        self.fin = None
+        self._al_terminar = []
+        self._lock = threading.Lock()
+
+    def al_terminar(self, funcion):
+        """Llama a funcion(mensaje) cuando el mensaje termine, se descarte o se corte"""
+        with self._lock:
+            if not self.terminado.is_set():
+                self._al_terminar.append(funcion)
+                return
+        funcion(self)
+
+    def finalizar(self):
+        with self._lock:
+            if self.terminado.is_set():
+                return
+            self.fin = time.perf_counter()
+            self.terminado.set()
+            pendientes, self._al_terminar = self._al_terminar, []
+        for funcion in pendientes:
+            funcion(self)
+
+
+class TrabajadorVoz:
+    """Cola de habla con prioridades atendida por un proceso de voz aparte
+
+    decir() vuelve de inmediato. Los textos repetidos que aún esperan turno se
+    ignoran, los mensajes normales demasiado viejos se descartan y un mensaje
+    prioritario corta lo que se esté diciendo. Las frases fijas se
+    pre-renderizan en segundo plano y luego se reproducen desde la caché.
+    """
+
+    def __init__(self, velocidad=220, volumen=0.9, indice_voz=1, frases_fijas=(), carpeta_cache=CARPETA_CACHE):
+        self.config = (velocidad, volumen, indice_voz, carpeta_cache, list(frases_fijas))
+        self.activo = False
+        self._pendientes = []  # heap de (nivel, orden, Mensaje)
+        self._en_curso = None
+        self._contador = itertools.count()
+        self._condicion = threading.Condition()
+        self._proceso = None
+
+    @property
+    def hablando(self):
+        """True mientras haya algo diciéndose o esperando turno"""
+        return self._en_curso is not None or bool(self._pendientes)
+
+    def iniciar(self):
+        """Arranca el proceso de voz (llamadas repetidas no hacen nada)"""
+        with self._condicion:
+            if self.activo:
+                return
+            self.activo = True
+            self._lanzar_proceso()
+            threading.Thread(target=self._despachar, daemon=True).start()
+
+    def _lanzar_proceso(self):
+        self._entrada = mp.Queue()
+        self._salida = mp.Queue()
+        self._interrumpir = mp.Value('q', -1)  # Identificador del mensaje a cortar
+        self._proceso = mp.Process(target=_proceso_voz, daemon=True,
+                                   args=(self._entrada, self._salida, self._interrumpir) + self.config)
+        self._proceso.start()
+
+    def _reiniciar_proceso(self):
+        """Reemplaza un motor que no respondió a tiempo"""
+        if self._proceso and self._proceso.is_alive():
+            self._proceso.terminate()
+        self._lanzar_proceso()
+
+    def detener(self):
+        """Cierra el proceso de voz"""
+        with self._condicion:
+            if not self.activo:
+                return
+            self.activo = False
+            self._condicion.notify_all()
+        self._entrada.put(None)
+        self._proceso.join(timeout=2)
+        if self._proceso.is_alive():
+            self._proceso.terminate()
+
+    def decir(self, texto, prioritario=False, al_terminar=None):
+        """Encola un texto y devuelve un Event que se activa cuando termina de decirse
+
+        al_terminar(mensaje), si se indica, recibe el Mensaje con sus tiempos.
+        """
+        self.iniciar()
+        with self._condicion:
+            # Evitar repetir lo que ya se está diciendo o ya espera turno
+            existente = None
+            if self._en_curso and self._en_curso.texto == texto and not prioritario:
+                existente = self._en_curso
+            for _, _, pendiente in self._pendientes:
+                if pendiente.texto == texto:
+                    existente = pendiente
+            if existente:
+                if al_terminar:
+                    existente.al_terminar(al_terminar)
+                return existente.terminado
+
+            mensaje = Mensaje(next(self._contador), texto, prioritario)
+            if al_terminar:
+                mensaje.al_terminar(al_terminar)
+            if prioritario and self._en_curso:
+                self._interrumpir.value = self._en_curso.id
+            heapq.heappush(self._pendientes, (0 if prioritario else 1, mensaje.id, mensaje))
+            self._condicion.notify()
+        return mensaje.terminado
+
+    def reproducir_earcon(self):
+        """Tono de confirmación breve que no bloquea al llamador"""
+        return self.decir(EARCON, prioritario=True)
+
+    def interrumpir(self):
+        """Corta lo que se está diciendo sin afectar a la cola"""
+        en_curso = self._en_curso
+        if en_curso:
+            self._interrumpir.value = en_curso.id
+
+    def callar(self):
+        """Corta lo que se está diciendo y descarta todo lo pendiente"""
+        with self._condicion:
+            descartados = [pendiente for _, _, pendiente in self._pendientes]
+            self._pendientes = []
+            self.interrumpir()
+        for pendiente in descartados:
+            pendiente.finalizar()
+
+    def _despachar(self):
+        while True:
+            with self._condicion:
+                self._condicion.wait_for(lambda: self._pendientes or not self.activo)
+                if not self.activo:
+                    break
+                _, _, mensaje = heapq.heappop(self._pendientes)
+                if not mensaje.prioritario and time.time() - mensaje.creado > CADUCIDAD:
+                    mensaje.finalizar()
+                    continue
+                self._en_curso = mensaje
+
+            mensaje.despachado = time.perf_counter()
+            self._entrada.put((mensaje.id, mensaje.texto))
+            self._esperar_fin(mensaje)
+            with self._condicion:
+                self._en_curso = None
+            mensaje.finalizar()
+
+    def _esperar_fin(self, mensaje):
+        """Espera el aviso del proceso de voz, reiniciándolo si se cuelga"""
+        inicio = time.time()
+        interrumpido_en = None
+        while self.activo:
+            try:
+                identificador, evento = self._salida.get(timeout=0.2)
+                if identificador == mensaje.id:
+                    if evento == "fin":
+                        return
+                    mensaje.inicio_audio = time.perf_counter()
+            except queue.Empty:
+                pass
+            if self._interrumpir.value == mensaje.id and interrumpido_en is None:
+                interrumpido_en = time.time()
+            if (not self._proceso.is_alive()
+                    or (interrumpido_en and time.time() - interrumpido_en > ESPERA_INTERRUPCION)
+                    or time.time() - inicio > DURACION_MAXIMA):
+                self._reiniciar_proceso()
+                return
+
+
+class VozNula:
+    """Sustituto de TrabajadorVoz que no sintetiza nada (pruebas y benchmarks)
+
+    Cada mensaje se da por dicho al instante, con los mismos tiempos y
+    callbacks que un mensaje real para que las trazas se cierren igual.
+    """
+
+    activo = True
+    hablando = False
+
+    def __init__(self):
+        self._contador = itertools.count()
+        self.dichos = 0
+
+    def iniciar(self):
+        pass
+
+    def detener(self):
+        pass
+
+    def decir(self, texto, prioritario=False, al_terminar=None):
+        mensaje = Mensaje(next(self._contador), texto, prioritario)
+        if al_terminar:
+            mensaje.al_terminar(al_terminar)
+        mensaje.despachado = mensaje.inicio_audio = time.perf_counter()
+        self.dichos += 1
+        mensaje.finalizar()
+        return mensaje.terminado
+
+    def reproducir_earcon(self):
+        return self.decir(EARCON, prioritario=True)
+
+    def interrumpir(self):
+        pass
+
+    def callar(self):
+        pass